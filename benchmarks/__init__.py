@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for the serializer hot paths, they run with ``pytest-benchmark``, see ``make benchmark``.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
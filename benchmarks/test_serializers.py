@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+import copy
+
+import pytest
+
+from rest_dataclasses.serializers import DataclassListSerializer, DataclassSerializer
+
+from tests.test_serializers import Geometry, Person, User
+
+pytest.importorskip("pytest_benchmark")
+
+SIZES = [10, 100, 1000]
+
+
+class UserSerializer(DataclassSerializer):
+    class Meta:
+        model = User
+        fields = "__all__"
+        list_serializer_class = DataclassListSerializer
+
+
+class GeometrySerializer(DataclassSerializer):
+    class Meta:
+        model = Geometry
+        fields = "__all__"
+        list_serializer_class = DataclassListSerializer
+
+
+class PersonSerializer(DataclassSerializer):
+    class Meta:
+        model = Person
+        fields = "__all__"
+
+
+def users(size):
+    return [{"id": i, "name": "user {}".format(i), "email": "user{}@example.com".format(i)} for i in range(size)]
+
+
+def geometry(size):
+    return {
+        "color": "RED",
+        "lines": [{"a": {"x": i, "y": i + 1}, "b": {"x": i + 2, "y": i + 3}} for i in range(size)],
+    }
+
+
+def geometries(size):
+    return [geometry(2) for _ in range(size)]
+
+
+def person(size):
+    return {
+        "name": "Sherlock Holmes",
+        "addresses": {
+            "address {}".format(i): {"street": "{} Baker Street".format(i), "city": "London"} for i in range(size)
+        },
+    }
+
+
+# shape: (serializer class, payload factory, many)
+SHAPES = {
+    "flat": (UserSerializer, users, True),
+    "nested": (GeometrySerializer, geometry, False),
+    "nested-many": (GeometrySerializer, geometries, True),
+    "dict": (PersonSerializer, person, False),
+}
+
+
+@pytest.fixture(params=sorted(SHAPES))
+def shape(request):
+    return request.param
+
+
+@pytest.fixture(params=SIZES)
+def size(request):
+    return request.param
+
+
+@pytest.fixture
+def payload(shape, size):
+    serializer_class, factory, many = SHAPES[shape]
+    return serializer_class, factory(size), many
+
+
+def build(serializer_class, data, many):
+    serializer = serializer_class(data=copy.deepcopy(data), many=many)
+    serializer.is_valid(raise_exception=True)
+    return serializer.save()
+
+
+def test_init(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "init-" + shape
+
+    def run():
+        serializer = serializer_class(data=data, many=many)
+        return serializer.child.fields if many else serializer.fields
+
+    benchmark(run)
+
+
+def test_is_valid(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "is_valid-" + shape
+
+    def run():
+        serializer = serializer_class(data=data, many=many)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(run)
+
+
+def test_data(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "data-" + shape
+    instance = build(serializer_class, data, many)
+
+    benchmark(lambda: serializer_class(instance, many=many).data)
+
+
+def test_create(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "create-" + shape
+
+    def run():
+        serializer = serializer_class(data=data, many=many)
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    benchmark(run)
+
+
+def test_update(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "update-" + shape
+    instance = build(serializer_class, data, many)
+
+    def run():
+        serializer = serializer_class(instance, data=data, many=many, partial=True)
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    benchmark(run)
+
+
+def test_dump_many(benchmark, payload, shape):
+    serializer_class, data, many = payload
+    benchmark.group = "data-" + shape
+    instance = build(serializer_class, data, many)
+    instances = instance if many else [instance]
+
+    benchmark(lambda: serializer_class.dump_many(instances))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+from collections import namedtuple
+
+Change = namedtuple("Change", ["path", "old", "new"])
+Change.__doc__ = """
+A single attribute change made by an update, ``path`` is the dotted path of the field, list items and dict values
+are addressed with their index or key, e.g. ``lines.0.a.x``.
+"""
+
+
+class ChangeSet(object):
+    """
+    Collects :class:`Change` records of an update, :meth:`nested` returns a view that records into the same list
+    under a path prefix.
+
+    >>> changes = ChangeSet()
+    >>> changes.nested("lines").nested(0).add("x", 1, 2)
+    >>> changes.changes
+    [Change(path='lines.0.x', old=1, new=2)]
+    """
+
+    __slots__ = ("prefix", "changes")
+
+    def __init__(self, prefix="", changes=None):
+        self.prefix = prefix
+        self.changes = [] if changes is None else changes
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def path(self, name):
+        return "{}.{}".format(self.prefix, name) if self.prefix else str(name)
+
+    def nested(self, name):
+        return ChangeSet(self.path(name), self.changes)
+
+    def add(self, name, old, new):
+        self.changes.append(Change(self.path(name), old, new))
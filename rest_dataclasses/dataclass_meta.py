@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers for introspecting dataclasses, annotations are resolved with ``typing.get_type_hints`` once per dataclass and
+normalized to :class:`FieldInfo` tuples.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+import dataclasses as da
+import threading
+import types
+import typing
+import weakref
+from collections import OrderedDict, namedtuple
+
+FieldInfo = namedtuple("FieldInfo", ["name", "field", "annotation", "type", "nullable", "container", "child_nullable"])
+FieldInfo.__doc__ = """
+Normalized description of a dataclass field.
+
+``type`` is the type of the value, or of the items when ``container`` is one of ``list``, ``tuple``, ``set``,
+``frozenset`` or ``dict``. It is ``None`` when the annotation doesn't say, e.g. a bare ``list``.
+"""
+
+CONTAINER_TYPES = (list, tuple, set, frozenset, dict)
+
+_UnionType = getattr(types, "UnionType", None)
+
+_field_info_cache = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_field_info(model):
+    """
+    Returns an ordered mapping of field name to :class:`FieldInfo` for the dataclass ``model``.
+    """
+    try:
+        return _field_info_cache[model]
+    except KeyError:
+        pass
+
+    info = OrderedDict((f.name, get_field_type_info(f, hint)) for f, hint in _get_type_hints(model))
+    with _lock:
+        return _field_info_cache.setdefault(model, info)
+
+
+def _get_type_hints(model):
+    assert da.is_dataclass(model), "{model} is not a dataclass".format(model=model)
+
+    localns = {model.__name__: model}
+    try:
+        hints = typing.get_type_hints(model, localns=localns)
+    except (NameError, TypeError):
+        # resolve the annotations one at a time so that only the ones that can't be resolved are left as they are
+        hints = {}
+        for klass in reversed(model.__mro__):
+            for name, annotation in klass.__dict__.get("__annotations__", {}).items():
+                holder = type(
+                    klass.__name__, (), {"__annotations__": {name: annotation}, "__module__": klass.__module__}
+                )
+                try:
+                    hints.update(typing.get_type_hints(holder, localns=localns))
+                except (NameError, TypeError):
+                    hints[name] = annotation
+
+    for f in da.fields(model):
+        hint = hints.get(f.name, f.type)
+        assert not isinstance(
+            hint, (str, typing.ForwardRef)
+        ), "Could not resolve the annotation {hint!r} of {model}.{field}".format(
+            hint=hint, model=model.__name__, field=f.name
+        )
+        yield f, hint
+
+
+def get_field_type_info(field, annotation):
+    typ, nullable = _unwrap_optional(annotation)
+    container = None
+    child_nullable = False
+
+    origin = _get_origin(typ)
+    if origin in CONTAINER_TYPES:
+        container = origin
+        args = [a for a in getattr(typ, "__args__", None) or () if not isinstance(a, typing.TypeVar)]
+        if container is dict:
+            assert not args or args[0] is str, "Nested dict key can only be string"
+            args = args[1:]
+        elif container is tuple:
+            args = [a for a in args if a is not Ellipsis]
+            if len(set(args)) > 1:
+                # heterogeneous tuples don't map to a single child field
+                args = []
+
+        if args:
+            typ, child_nullable = _unwrap_optional(args[0])
+        else:
+            typ = None
+
+    return FieldInfo(
+        name=field.name,
+        field=field,
+        annotation=annotation,
+        type=typ,
+        nullable=nullable,
+        container=container,
+        child_nullable=child_nullable,
+    )
+
+
+def has_default(field):
+    return field.default is not da.MISSING or field.default_factory is not da.MISSING
+
+
+def is_frozen(model):
+    return model.__dataclass_params__.frozen
+
+
+def _get_origin(typ):
+    if typ in CONTAINER_TYPES:
+        return typ
+    return getattr(typ, "__origin__", None)
+
+
+def _is_union(typ):
+    return getattr(typ, "__origin__", None) is typing.Union or (_UnionType is not None and isinstance(typ, _UnionType))
+
+
+def _unwrap_optional(typ):
+    if not _is_union(typ):
+        return typ, False
+
+    args = [a for a in typ.__args__ if a is not type(None)]  # noqa
+    nullable = len(args) != len(typ.__args__)
+    assert len(args) == 1, "Union annotations other than Optional[X] are not supported, got {typ!r}".format(typ=typ)
+    return args[0], nullable
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from .utils import django_to_drf_error_detail, list_errors_as_dict
+
+
+class TooManyErrors(Exception):
+    """
+    Raised by :class:`ErrorCollector` once ``max_errors`` errors have been recorded.
+    """
+
+
+class ErrorCollector(object):
+    """
+    Records errors along with their path, the DRF error tree is only built by :meth:`as_dict` once collection is
+    done. :meth:`nested` returns a view that records into the same collector under a path prefix.
+
+    >>> errors = ErrorCollector()
+    >>> errors.nested("lines").nested(0).add("a", ValueError("Bad", "value"))
+    >>> errors.as_dict()
+    {'lines': {0: {'a': ['Bad value']}}}
+
+    ``update`` and ``setdefault`` record into the collector like they did into the dict of errors that
+    ``perform_update`` used to get.
+    """
+
+    __slots__ = ("max_errors", "prefix", "entries")
+
+    def __init__(self, max_errors=None, prefix=(), entries=None):
+        self.max_errors = max_errors
+        self.prefix = prefix
+        self.entries = [] if entries is None else entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def nested(self, key):
+        return ErrorCollector(self.max_errors, self.prefix + (key,), self.entries)
+
+    def add(self, name, error):
+        """
+        Records ``error`` for the field ``name``, ``error`` is a message, a DRF ``ValidationError`` or an exception
+        whose arguments make up the message. Without ``name`` it's a django ``ValidationError`` merged in as is.
+        """
+        self.entries.append((self.prefix, name, error))
+        if self.max_errors is not None and len(self.entries) >= self.max_errors:
+            raise TooManyErrors(self.max_errors)
+
+    def update(self, detail):
+        for name, messages in detail.items():
+            self.entries.append((self.prefix, name, messages))
+
+    def setdefault(self, name, default=None):
+        messages = [] if default is None else default
+        self.entries.append((self.prefix, name, messages))
+        return messages
+
+    def as_dict(self):
+        tree = {}
+        for prefix, name, error in self.entries:
+            node = tree
+            for key in prefix:
+                node = _get_node(node, key)
+
+            if name is None:
+                for key, messages in django_to_drf_error_detail(error).items():
+                    _add_messages(node, key, messages)
+            elif isinstance(error, ValidationError):
+                _add_messages(node, name, error.detail)
+            elif isinstance(error, (list, dict)):
+                _add_messages(node, name, error)
+            else:
+                _add_messages(node, name, [_format(error)])
+
+        return tree if list_errors_as_dict() else _as_lists(tree)
+
+    def as_validation_error(self):
+        return ValidationError(self.as_dict())
+
+
+def _format(error):
+    if isinstance(error, Exception):
+        return " ".join(map(str, error.args))
+    return error
+
+
+def _as_lists(node):
+    if not isinstance(node, dict):
+        return node
+    node = {key: _as_lists(child) for key, child in node.items()}
+    # list items are nested by index, only the items up to the last one with errors are known here
+    if node and all(isinstance(key, int) for key in node):
+        return [node.get(index, {}) for index in range(max(node) + 1)]
+    return node
+
+
+def _get_node(node, key):
+    child = node.setdefault(key, {})
+    if isinstance(child, list):
+        child = node[key] = {api_settings.NON_FIELD_ERRORS_KEY: child}
+    return child
+
+
+def _add_messages(node, key, messages):
+    if isinstance(messages, dict):
+        child = _get_node(node, key)
+        for k, v in messages.items():
+            _add_messages(child, k, v)
+        return
+
+    existing = node.setdefault(key, [])
+    if isinstance(existing, dict):
+        existing = existing.setdefault(api_settings.NON_FIELD_ERRORS_KEY, [])
+    existing.extend(messages)
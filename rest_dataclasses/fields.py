@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+import base64
+import binascii
+import pathlib
+
+from rest_framework import fields
+
+
+class CollectionField(fields.ListField):
+    """
+    A ``ListField`` that returns its validated items as ``container``, e.g. a ``tuple`` or a ``set``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.container = kwargs.pop("container", list)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        return self.container(super().to_internal_value(data))
+
+
+class BytesField(fields.Field):
+    """
+    Represents ``bytes`` as a base64 encoded string.
+    """
+
+    default_error_messages = {"invalid": "Must be a valid base64 string."}
+
+    def to_internal_value(self, data):
+        if isinstance(data, bytes):
+            return data
+        try:
+            return base64.b64decode(data, validate=True)
+        except (TypeError, ValueError, binascii.Error):
+            self.fail("invalid")
+
+    def to_representation(self, value):
+        return base64.b64encode(value).decode("ascii")
+
+
+class PathField(fields.CharField):
+    """
+    A ``CharField`` that returns its validated value as a ``pathlib.Path``.
+    """
+
+    def to_internal_value(self, data):
+        return pathlib.Path(super().to_internal_value(data))
+
+    def to_representation(self, value):
+        return str(value)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Optional instrumentation of the serializer phases.
+
+Hooks are callables that receive an :class:`Event` each time an instrumented phase of a serializer completes, e.g.
+``run_validation`` or ``to_representation`` of a nested field. The phases are ``build_fields``, ``get_fields``,
+``run_validation``, ``to_representation``, ``perform_create``, ``perform_update`` and their ``_many`` list
+counterparts. Nothing is measured unless a hook is registered::
+
+    aggregator = Aggregator()
+    with instrument(aggregator):
+        serializer.data
+
+    aggregator.stats[("to_representation", "lines")].duration
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+import functools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from rest_framework.exceptions import ValidationError
+
+Event = namedtuple("Event", ["phase", "serializer", "path", "duration", "items", "errors"])
+Event.__doc__ = """
+A completed phase of ``serializer``, ``path`` is the dotted path of the serializer from the root serializer and
+``errors`` the number of errors raised or collected while running it.
+"""
+
+hooks = []
+
+_lock = threading.Lock()
+
+
+def add_hook(hook):
+    with _lock:
+        hooks.append(hook)
+
+
+def remove_hook(hook):
+    with _lock:
+        hooks.remove(hook)
+
+
+class instrument(object):
+    """
+    Context manager that registers ``hook`` for the duration of the block.
+    """
+
+    def __init__(self, hook):
+        self.hook = hook
+
+    def __enter__(self):
+        add_hook(self.hook)
+        return self.hook
+
+    def __exit__(self, *args):
+        remove_hook(self.hook)
+
+
+def get_path(field):
+    names = []
+    while field is not None:
+        if field.field_name:
+            names.append(field.field_name)
+        field = field.parent
+    return ".".join(reversed(names))
+
+
+def emit(serializer, phase, duration, items=1, errors=0):
+    event = Event(phase, serializer, get_path(serializer), duration, items, errors)
+    for hook in list(hooks):
+        hook(event)
+
+
+def count_first(data=None, *args, **kwargs):
+    """
+    Counts the items of the first argument, e.g. the data of a list serializer.
+    """
+    try:
+        return len(data)
+    except TypeError:
+        return 0
+
+
+def instrumented(phase, count_items=None, count_errors=None):
+    """
+    Decorates a serializer method to emit an :class:`Event` for ``phase``. ``count_items`` and ``count_errors`` are
+    called with the arguments of the method to fill in the event counts, ``count_errors`` before and after the call
+    as the method collects errors. Without registered hooks the method is called directly.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(serializer, *args, **kwargs):
+            if not hooks:
+                return func(serializer, *args, **kwargs)
+
+            items = count_items(*args, **kwargs) if count_items is not None else 1
+            before = count_errors(*args, **kwargs) if count_errors is not None else 0
+            errors = 0
+            start = time.perf_counter()
+            try:
+                return func(serializer, *args, **kwargs)
+            except ValidationError:
+                errors = 1
+                raise
+            finally:
+                if count_errors is not None:
+                    errors += count_errors(*args, **kwargs) - before
+                emit(serializer, phase, time.perf_counter() - start, items=items, errors=errors)
+
+        return wrapper
+
+    return decorator
+
+
+class Stats(object):
+    __slots__ = ("calls", "duration", "max_duration", "items", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.duration = 0.0
+        self.max_duration = 0.0
+        self.items = 0
+        self.errors = 0
+
+    def __repr__(self):
+        return "<Stats calls={} duration={:.6f} max_duration={:.6f} items={} errors={}>".format(
+            self.calls, self.duration, self.max_duration, self.items, self.errors
+        )
+
+
+class Aggregator(object):
+    """
+    A hook that sums up events per ``(phase, path)``.
+    """
+
+    def __init__(self):
+        self.stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            stats = self.stats.get((event.phase, event.path))
+            if stats is None:
+                stats = self.stats[(event.phase, event.path)] = Stats()
+            stats.calls += 1
+            stats.duration += event.duration
+            stats.max_duration = max(stats.max_duration, event.duration)
+            stats.items += event.items
+            stats.errors += event.errors
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+    def most_expensive(self, count=None):
+        """
+        Returns the ``(phase, path), stats`` pairs sorted by their total duration, slowest first.
+        """
+        ret = sorted(self.stats.items(), key=lambda item: item[1].duration, reverse=True)
+        return ret if count is None else ret[:count]
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Validation and construction of large ``many=True`` batches in a ``concurrent.futures`` executor.
+
+Items are sent to the workers in chunks along with the child serializer class, which builds its fields and plans
+once per worker process through the usual class cache, so only the serializer class, its options and the items have
+to be pickled. The child serializer class has to be importable, e.g. defined at module level, the values of the
+serializer ``context`` that can't be pickled are left out, see :meth:`ParallelListSerializer.get_worker_context`::
+
+    class ImportListSerializer(ParallelListSerializer):
+        executor = ProcessPoolExecutor()
+        chunk_size = 500
+
+    class UserSerializer(DataclassSerializer):
+        class Meta:
+            model = User
+            fields = "__all__"
+            list_serializer_class = ImportListSerializer
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+import pickle
+
+from rest_framework.exceptions import ValidationError
+
+from .errors import TooManyErrors
+from .serializers import DataclassListSerializer
+
+
+def _get_serializer(serializer_class, kwargs, selection):
+    serializer = serializer_class(**kwargs)
+    if selection != (None, None):
+        serializer.select_fields(*selection)
+    return serializer
+
+
+def validate_chunk(serializer_class, kwargs, selection, items):
+    """
+    Returns a ``(valid, validated data or error detail)`` pair for each of ``items``.
+    """
+    serializer = _get_serializer(serializer_class, kwargs, selection)
+    ret = []
+    for item in items:
+        try:
+            ret.append((True, serializer.run_validation(item)))
+        except ValidationError as e:
+            ret.append((False, e.detail))
+    return ret
+
+
+def create_chunk(serializer_class, kwargs, selection, items, offset):
+    """
+    Builds the instances of ``items``, returns them along with the error entries recorded for them.
+    """
+    serializer = _get_serializer(serializer_class, kwargs, selection)
+    errors = serializer.get_error_collector()
+    instances = []
+    try:
+        for index, item in enumerate(items, offset):
+            instance = serializer.get_object(item, None, errors.nested(index))
+            if instance:
+                instances.append(instance)
+    except TooManyErrors:
+        pass
+    return instances, errors.entries
+
+
+class ParallelListSerializer(DataclassListSerializer):
+    """
+    A :class:`~rest_dataclasses.serializers.DataclassListSerializer` that validates and creates batches of more than
+    ``chunk_size`` items in ``executor``, results and errors are merged back in the order of the items. Without an
+    executor, for smaller batches, nested lists and updates of existing instances it works like its base class.
+    """
+
+    executor = None
+    chunk_size = 1000
+
+    def __init__(self, *args, **kwargs):
+        self.executor = kwargs.pop("executor", self.executor)
+        self.chunk_size = kwargs.pop("chunk_size", self.chunk_size)
+        super().__init__(*args, **kwargs)
+
+    def is_parallel(self, items):
+        return (
+            self.executor is not None
+            and self.parent is None
+            and isinstance(items, list)
+            and len(items) > self.chunk_size
+        )
+
+    def get_worker_kwargs(self):
+        """
+        Returns the keyword arguments the child serializer is created with in the workers.
+        """
+        child = self.child
+        return {
+            "allow_nested_updates": child.allow_nested_updates,
+            "allow_create": child.allow_create,
+            "max_errors": child.max_errors,
+            "partial": self.partial,
+            "context": self.get_worker_context(),
+        }
+
+    def get_worker_context(self):
+        """
+        Returns the ``context`` the child serializer gets in the workers, values that can't be pickled, such as the
+        ``request`` and ``view`` of DRF views, are left out.
+        """
+        context = {}
+        for key, value in self.context.items():
+            try:
+                pickle.dumps(value)
+            except Exception:
+                continue
+            context[key] = value
+        return context
+
+    def map_chunks(self, func, items, with_offset=False):
+        """
+        Submits ``func`` for each ``chunk_size`` slice of ``items``, followed by the index of its first item when
+        ``with_offset`` is set, and yields the results in order, the pending chunks are cancelled when the iteration
+        stops early.
+        """
+        args = (self.child.__class__, self.get_worker_kwargs(), (self.child.only_fields, self.child.omit_fields))
+        futures = []
+        for start in range(0, len(items), self.chunk_size):
+            end = start + self.chunk_size
+            chunk = (items[start:end], start) if with_offset else (items[start:end],)
+            futures.append(self.executor.submit(func, *args, *chunk))
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def iter_validation_results(self, items):
+        if not self.is_parallel(items):
+            yield from super().iter_validation_results(items)
+            return
+
+        chunks = self.map_chunks(validate_chunk, items)
+        try:
+            for results in chunks:
+                yield from results
+        finally:
+            chunks.close()
+
+    def create_many(self, validated_data):
+        if not self.is_parallel(validated_data) or self.child.track_changes:
+            return super().create_many(validated_data)
+
+        errors = self.child.get_error_collector()
+        instances = []
+        for chunk_instances, entries in self.map_chunks(create_chunk, validated_data, with_offset=True):
+            instances.extend(chunk_instances)
+            errors.entries.extend(entries)
+
+        max_errors = errors.max_errors
+        if max_errors is not None:
+            del errors.entries[max_errors:]
+
+        if errors:
+            raise errors.as_validation_error()
+
+        return instances
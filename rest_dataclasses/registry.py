@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Mapping of python types to the serializer fields built for them.
+
+A registry resolves a type to the factory registered for it or for its closest base class, enums are looked up along
+their enum bases first so that e.g. an ``IntEnum`` maps to the enum field rather than the ``int`` one. Resolved
+lookups are memoized. A registry can be derived from another one with :meth:`FieldRegistry.new_child`, the child only
+holds its overrides and falls back to its parent for everything else::
+
+    class MoneySerializer(DataclassSerializer):
+        serializer_field_mapping = field_registry.new_child({Money: MoneyField})
+
+        class Meta:
+            model = Price
+            fields = "__all__"
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+import enum
+import threading
+import uuid
+from collections.abc import MutableMapping
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from rest_framework import fields
+
+from rest_enumfield import EnumField
+
+from .fields import BytesField, PathField
+
+
+class FieldRegistry(MutableMapping):
+    """
+    Maps types to field factories, a factory is called with the field keyword arguments and returns the field, e.g. a
+    field class. It's a mutable mapping of the exact types registered on it and its parents, assignments and deletions
+    go through :meth:`register` and :meth:`unregister`.
+
+    >>> registry = FieldRegistry({int: fields.IntegerField})
+    >>> registry.lookup(bool) is fields.IntegerField
+    True
+    >>> child = registry.new_child({bool: fields.BooleanField})
+    >>> child.lookup(bool) is fields.BooleanField, registry.lookup(bool) is fields.IntegerField
+    (True, True)
+    """
+
+    # bumped by every registration so that memoized lookups of the registry and of its children are dropped
+    _version = 0
+    _lock = threading.Lock()
+
+    def __init__(self, mapping=None, parent=None):
+        self.parent = parent
+        self._mapping = dict(mapping or {})
+        self._cache = {}
+        self._cache_version = None
+
+    def __repr__(self):
+        return "<{} {!r}>".format(self.__class__.__name__, self.as_dict())
+
+    def __contains__(self, typ):
+        return self.get(typ) is not None
+
+    def __getitem__(self, typ):
+        factory = self.get(typ)
+        if factory is None:
+            raise KeyError(typ)
+        return factory
+
+    def __setitem__(self, typ, factory):
+        self.register(typ, factory)
+
+    def __delitem__(self, typ):
+        self.unregister(typ)
+
+    def __iter__(self):
+        return iter(self.as_dict())
+
+    def __len__(self):
+        return len(self.as_dict())
+
+    def as_dict(self):
+        """
+        Returns the exact type to factory mapping of this registry merged over its parents.
+        """
+        ret = self.parent.as_dict() if self.parent is not None else {}
+        ret.update(self._mapping)
+        return ret
+
+    def copy(self):
+        return self.as_dict()
+
+    def get(self, typ, default=None):
+        """
+        Returns the factory registered for exactly ``typ`` or ``default``.
+        """
+        registry = self
+        while registry is not None:
+            if typ in registry._mapping:
+                return registry._mapping[typ]
+            registry = registry.parent
+        return default
+
+    def register(self, typ, factory=None):
+        """
+        Registers ``factory`` for ``typ`` and its subclasses, without ``factory`` it returns a decorator.
+        """
+        if factory is None:
+
+            def decorator(factory):
+                self.register(typ, factory)
+                return factory
+
+            return decorator
+
+        with self._lock:
+            self._mapping[typ] = factory
+            FieldRegistry._version += 1
+
+        return factory
+
+    def unregister(self, typ):
+        with self._lock:
+            del self._mapping[typ]
+            FieldRegistry._version += 1
+
+    def new_child(self, mapping=None):
+        return self.__class__(mapping, parent=self)
+
+    def lookup(self, typ):
+        """
+        Returns the factory for ``typ`` or for its closest registered base class, ``None`` when there is none.
+        """
+        if self._cache_version != FieldRegistry._version:
+            self._cache = {}
+            self._cache_version = FieldRegistry._version
+
+        try:
+            return self._cache[typ]
+        except KeyError:
+            pass
+
+        mro = getattr(typ, "__mro__", ())
+        if enum.Enum in mro:
+            mro = [t for t in mro if issubclass(t, enum.Enum)] + [t for t in mro if not issubclass(t, enum.Enum)]
+
+        factory = next((f for f in map(self.get, mro) if f is not None), None)
+        self._cache[typ] = factory
+        return factory
+
+
+field_registry = FieldRegistry(
+    {
+        bool: fields.BooleanField,
+        bytes: BytesField,
+        date: fields.DateField,
+        datetime: fields.DateTimeField,
+        Decimal: fields.DecimalField,
+        enum.Enum: EnumField,
+        float: fields.FloatField,
+        int: fields.IntegerField,
+        Path: PathField,
+        str: fields.CharField,
+        time: fields.TimeField,
+        timedelta: fields.DurationField,
+        uuid.UUID: fields.UUIDField,
+    }
+)
@@ -3,39 +3,301 @@ from __future__ import absolute_import, print_function, unicode_literals
 import copy
 import dataclasses as da
 import enum
+import inspect
 import itertools
-from collections import OrderedDict
-from datetime import date, datetime, time, timedelta
-from decimal import Decimal
+import operator
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from asgiref.sync import async_to_sync, sync_to_async
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.functional import cached_property
 
 from rest_framework import fields, serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.fields import SkipField, empty, get_error_detail
+from rest_framework.settings import api_settings
+from rest_framework.utils.serializer_helpers import BindingDict
 
 from rest_enumfield import EnumField
 
-from .utils import django_to_drf_validation_error
+from .changes import ChangeSet
+from .dataclass_meta import get_field_info, has_default, is_frozen
+from .errors import ErrorCollector, TooManyErrors
+from .fields import BytesField, CollectionField, PathField
+from .instrumentation import count_first, instrumented
+from .registry import FieldRegistry, field_registry
+from .utils import list_errors_as_dict, parse_field_paths
+
+# the validated Meta options, fields is None for "__all__" and extra_kwargs a read only mapping that already includes
+# read_only_fields
+MetaOptions = namedtuple("MetaOptions", ["fields", "exclude", "extra_kwargs", "depth"])
+
+
+class NestedSerializerRegistry(object):
+    # bounded LRU of the generated nested serializer classes keyed on (parent serializer class, dataclass, depth)
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._classes = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._classes)
+
+    def __contains__(self, key):
+        return key in self._classes
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        with self._lock:
+            return list(self._classes)
+
+    def items(self):
+        with self._lock:
+            return list(self._classes.items())
+
+    def get(self, key):
+        with self._lock:
+            serializer_class = self._classes.get(key)
+            if serializer_class is not None:
+                self._classes.move_to_end(key)
+            return serializer_class
+
+    def add(self, key, serializer_class):
+        with self._lock:
+            serializer_class = self._classes.setdefault(key, serializer_class)
+            self._classes.move_to_end(key)
+            while self.maxsize is not None and len(self._classes) > self.maxsize:
+                self._classes.popitem(last=False)
+            return serializer_class
+
+    def clear(self):
+        with self._lock:
+            self._classes.clear()
+
+
+nested_serializer_registry = NestedSerializerRegistry()
+
+
+class DeferredField(object):
+    # built with the serializer method builder on first access, later instances get a copy of the built field
+
+    def __init__(self, builder, *args):
+        self.builder = builder
+        self.args = args
+        self.prototype = None
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "{cls}({builder}{args!r})".format(cls=self.__class__.__name__, builder=self.builder, args=self.args)
+
+    def build(self, serializer):
+        if self.prototype is None:
+            self.prototype = getattr(serializer, self.builder)(*self.args)
+        return copy.deepcopy(self.prototype)
+
+
+class FieldTemplate(DeferredField):
+    # a stateless field shared by every instance for converting values, fields still gets its own bound copy
+
+    def __init__(self, field):
+        super().__init__(None)
+        self.prototype = field
+
+    @property
+    def field(self):
+        return self.prototype
+
+    def __repr__(self):
+        return "{cls}({field!r})".format(cls=self.__class__.__name__, field=self.prototype)
+
+
+class LazyBindingDict(BindingDict):
+    def __init__(self, serializer):
+        super().__init__(serializer)
+        self.selections = {}
+
+    def __contains__(self, key):
+        return key in self.fields
+
+    def __setitem__(self, key, field):
+        if isinstance(field, DeferredField):
+            self.fields[key] = field
+        else:
+            super().__setitem__(key, field)
+
+    def __getitem__(self, key):
+        field = self.fields[key]
+        if isinstance(field, DeferredField):
+            field = field.build(self.serializer)
+            self.apply_selection(field, *self.selections.pop(key, (None, None)))
+            super().__setitem__(key, field)
+        return field
+
+    def select(self, key, field, only=None, omit=None):
+        if isinstance(field, DeferredField):
+            if only is not None or omit is not None:
+                self.selections[key] = (only, omit)
+        else:
+            self.apply_selection(field, only, omit)
+        self[key] = field
+
+    def apply_selection(self, field, only, omit):
+        if only is None and omit is None:
+            return
+
+        field = getattr(field, "child", field)
+        if isinstance(field, DataclassSerializer):
+            field.select_fields(only, omit)
+
+
+# fields that keep no state besides their options and don't look at their parent for non-empty values
+_STATELESS_FIELDS = frozenset(
+    [
+        BytesField,
+        EnumField,
+        PathField,
+        fields.BooleanField,
+        fields.CharField,
+        fields.DateField,
+        fields.DateTimeField,
+        fields.DecimalField,
+        fields.DurationField,
+        fields.FloatField,
+        fields.IntegerField,
+        fields.TimeField,
+        fields.UUIDField,
+    ]
+)
+
+# fields whose representation of trusted dataclass attributes is the attribute itself
+_PRIMITIVE_FIELDS = frozenset([fields.BooleanField, fields.CharField, fields.FloatField, fields.IntegerField])
+
+
+def _dump_dict(plan, instance):
+    ret = {}
+    for field_name, getter, converter in plan:
+        value = getter(instance)
+        ret[field_name] = value if value is None or converter is None else converter(value)
+    return ret
+
+
+def _dump_tuple(plan, instance):
+    ret = []
+    for _, getter, converter in plan:
+        value = getter(instance)
+        ret.append(value if value is None or converter is None else converter(value))
+    return tuple(ret)
+
+
+def _nested_dumper(serializer):
+    # the nested plan is resolved on first use so that recursive dataclasses don't recurse while building plans
+    plan = []
+
+    def dump(instance):
+        if not plan:
+            plan.append(serializer.get_dump_plan())
+        return _dump_dict(plan[0], instance)
+
+    return dump
+
+
+def _same(old, new):
+    return old is new or (type(old) is type(new) and old == new)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _resolve(value):
+    # validate_<field> and set_<field> hooks can be coroutines, they're run on the event loop of the async API or on
+    # a new one for the sync API
+    if inspect.isawaitable(value):
+        return async_to_sync(_await)(value)
+    return value
+
+
+class AsyncSerializerMixin(object):
+    # the work is done in a worker thread so that big payloads don't block the event loop, coroutine
+    # validate_<field> and set_<field> hooks are awaited on the loop
+
+    async def ais_valid(self, raise_exception=False):
+        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        return await sync_to_async(self.save)(**kwargs)
+
+    async def adata(self):
+        return await sync_to_async(getattr)(self, "data")
+
+    async def aiter_representation(self, iterable, chunk_size=100):
+        # instances are converted chunk_size at a time in a worker thread, which also consumes a sync iterable
+        represent = sync_to_async(lambda chunk: [self.to_representation(instance) for instance in chunk])
+
+        if hasattr(iterable, "__aiter__"):
+            chunk = []
+            async for instance in iterable:
+                chunk.append(instance)
+                if len(chunk) >= chunk_size:
+                    for item in await represent(chunk):
+                        yield item
+                    chunk = []
+            for item in await represent(chunk) if chunk else ():
+                yield item
+            return
+
+        iterator = iter(iterable)
+        while True:
+            items = await represent(itertools.islice(iterator, chunk_size))
+            if not items:
+                return
+            for item in items:
+                yield item
+
+
+def _all_subclasses(cls):
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_all_subclasses(subclass))
+    return subclasses
+
 
+class DataclassSerializer(AsyncSerializerMixin, serializers.Serializer):
 
-class DataclassSerializer(serializers.Serializer):
+    nested_serializer_registry = nested_serializer_registry
 
-    serializer_field_mapping = {
-        int: fields.IntegerField,
-        str: fields.CharField,
-        date: fields.DateField,
-        datetime: fields.DateTimeField,
-        Decimal: fields.DecimalField,
-        time: fields.TimeField,
-        timedelta: fields.DurationField,
-        enum.Enum: EnumField,
-    }
+    changes = None
+
+    serializer_field_mapping = field_registry
 
     def __init__(self, *args, **kwargs):
         self.allow_nested_updates = kwargs.pop("allow_nested_updates", True)
         self.allow_create = kwargs.pop("allow_create", True)
+        self.track_changes = kwargs.pop("track_changes", False)
+        self.match_on = kwargs.pop("match_on", None)
+        self.max_errors = kwargs.pop("max_errors", None)
+        if kwargs.pop("fail_fast", False):
+            self.max_errors = 1
+        self.only_fields = parse_field_paths(kwargs.pop("fields", None))
+        self.omit_fields = parse_field_paths(kwargs.pop("omit", None))
         super().__init__(*args, **kwargs)
 
+        assert (
+            self.match_on is None or self.match_on in self.get_field_schema()
+        ), 'Cannot match on "{field}", it is not a field of {cls}'.format(
+            field=self.match_on, cls=self.__class__.__name__
+        )
+
     @property
     def model(self):
         assert hasattr(self.Meta, "model"), 'Class {serializer_class} missing "Meta.model" attribute'.format(
@@ -43,19 +305,116 @@ class DataclassSerializer(serializers.Serializer):
         )
         return self.Meta.model
 
+    @classmethod
+    def invalidate_field_schema(cls):
+        # needed when Meta is changed at runtime
+        for klass in [cls] + _all_subclasses(cls):
+            if "_class_cache" in klass.__dict__:
+                delattr(klass, "_class_cache")
+
+    def get_class_cache(self):
+        # reset whenever Meta is replaced or invalidate_field_schema is called
+        cls = self.__class__
+        cache = cls.__dict__.get("_class_cache")
+        if cache is None or cache["meta"] is not self.Meta:
+            cache = {"meta": self.Meta}
+            cls._class_cache = cache
+
+        return cache
+
+    def get_plan_cache(self):
+        # the fields of an overridden get_fields can differ between instances, each instance has its own plans then
+        if type(self).get_fields is DataclassSerializer.get_fields:
+            return self.get_class_cache()
+
+        return self.__dict__.setdefault("_plan_cache", {})
+
+    def get_field_schema(self):
+        # the unbound fields, built once per class and Meta
+        cache = self.get_class_cache()
+        if "fields" not in cache:
+            cache["fields"] = self.build_fields()
+
+        return cache["fields"]
+
     def get_fields(self):
+        return OrderedDict(
+            (key, field.build(self) if isinstance(field, DeferredField) else copy.deepcopy(field))
+            for key, field in self.get_field_schema().items()
+        )
 
-        declared_fields = copy.deepcopy(self._declared_fields)
-        dataclass_fields = {f.name: f for f in da.fields(self.model)}
-        depth = getattr(self.Meta, "depth", 0)
+    @instrumented("get_fields")
+    def _get_fields(self):
+        # unless get_fields is overridden the fields are copied from the schema as is, nested and shared fields are
+        # only built when they're first accessed
+        if type(self).get_fields is DataclassSerializer.get_fields:
+            return copy.deepcopy(self.get_field_schema())
+
+        return self.get_fields()
+
+    def get_field_selection(self):
+        # a top level serializer falls back to the fields and omit context keys
+        if self.only_fields is None and self.omit_fields is None:
+            parent = self.parent
+            if parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None):
+                return parse_field_paths(self.context.get("fields")), parse_field_paths(self.context.get("omit"))
+
+        return self.only_fields, self.omit_fields
+
+    @cached_property
+    def fields(self):
+        only, omit = self.get_field_selection()
+        if only is None and omit is None:
+            fields = LazyBindingDict(self)
+            for key, value in self._get_fields().items():
+                fields[key] = value
+            return fields
 
-        if depth is not None:
-            assert depth >= 0, "'depth' may not be negative."
-            assert depth <= 5, "'depth' may not be greater than 5."
+        # prune the schema before anything gets copied or built
+        fields = LazyBindingDict(self)
+        for key, value in self.get_field_schema().items():
+            if only is not None and key not in only:
+                continue
+            if omit is not None and key in omit and omit[key] is None:
+                continue
+
+            fields.select(
+                key,
+                copy.deepcopy(value),
+                only.get(key) if only is not None else None,
+                omit.get(key) if omit is not None else None,
+            )
+
+        return fields
+
+    @cached_property
+    def _all_fields(self):
+        # the plans are always computed from the complete set of fields, the per-class ones from a separate copy so
+        # that the fields of this instance are still built lazily
+        if self.get_field_selection() == (None, None) and self.get_plan_cache() is not self.get_class_cache():
+            return self.fields
+
+        fields = LazyBindingDict(self)
+        for key, value in self._get_fields().items():
+            fields[key] = value
+        return fields
+
+    def select_fields(self, only=None, omit=None):
+        # has to be called before fields is accessed
+        self.only_fields = only
+        self.omit_fields = omit
+
+    @instrumented("build_fields")
+    def build_fields(self):
+
+        options = self.get_options()
+        declared_fields = self._declared_fields
+        dataclass_fields = get_field_info(self.model)
+        depth = options.depth
 
         field_names = self.get_field_names(declared_fields, dataclass_fields)
 
-        extra_kwargs = self.get_extra_kwargs()
+        extra_kwargs = options.extra_kwargs
 
         fields = OrderedDict()
         for field_name in field_names:
@@ -72,10 +431,297 @@ class DataclassSerializer(serializers.Serializer):
 
         return fields
 
-    def get_field_names(self, declared_fields, dataclass_fields):
+    def get_representation_plan(self):
+        # (field_name, attribute) pairs where a None attribute goes through get_attribute
+        cache = self.get_plan_cache()
+        if "representation" not in cache:
+            cache["representation"] = tuple(
+                (field.field_name, field.source_attrs[0] if self.is_plain_field(field) else None)
+                for field in self._all_fields.values()
+                if not field.write_only
+            )
+
+        return cache["representation"]
+
+    def is_plain_field(self, field):
+        return (
+            field.field_name not in self._declared_fields
+            and type(field).get_attribute is fields.Field.get_attribute
+            and len(field.source_attrs) == 1
+        )
+
+    def is_stateless_field(self, field):
+        return type(field) in _STATELESS_FIELDS
+
+    def get_plan_field(self, field_name, attr):
+        # plain attributes of an unbuilt template use its shared field, other unbuilt fields are built on first use
+        # so that nested fields are only built for non-null values
+        if attr is None:
+            return self.fields[field_name]
+        field = self.fields.fields[field_name]
+        if isinstance(field, FieldTemplate):
+            return field.field
+        return None
+
+    @cached_property
+    def _representation_plan(self):
+        # unbuilt fields follow the class plan, fields this instance built or added are looked at as they are now
+        attrs = dict(self.get_representation_plan())
+        plan = []
+        for field_name, field in self.fields.fields.items():
+            if isinstance(field, DeferredField):
+                if field_name not in attrs:
+                    continue
+                attr = attrs[field_name]
+                field = self.get_plan_field(field_name, attr)
+            elif field.write_only:
+                continue
+            else:
+                attr = field.source_attrs[0] if field_name in attrs and self.is_plain_field(field) else None
+            plan.append([field_name, field, attr])
+        return plan
+
+    @instrumented("to_representation")
+    def to_representation(self, instance):
+        ret = OrderedDict()
+
+        for entry in self._representation_plan:
+            field_name, field, attr = entry
+            attribute = empty if attr is None else getattr(instance, attr, empty)
+            if attribute is None:
+                ret[field_name] = None
+                continue
+
+            if attribute is empty:
+                if attr is not None:
+                    # a missing attribute goes through the bound field
+                    field = self.fields[field_name]
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+            elif field is None:
+                field = entry[1] = self.fields[field_name]
+
+            ret[field_name] = None if attribute is None else field.to_representation(attribute)
+
+        return ret
+
+    def iter_representation(self, iterable):
+        for instance in iterable:
+            yield self.to_representation(instance)
+
+    @classmethod
+    def dump_many(cls, instances, output="dict"):
+        # converts trusted instances straight to primitive values without running the field machinery for each instance
+        plan = cls().get_dump_plan()
+
+        if output == "dict":
+            return [_dump_dict(plan, instance) for instance in instances]
+
+        if output == "tuple":
+            return [_dump_tuple(plan, instance) for instance in instances]
+
+        if output == "columns":
+            columns = [[] for _ in plan]
+            appends = [column.append for column in columns]
+            for instance in instances:
+                for append, value in zip(appends, _dump_tuple(plan, instance)):
+                    append(value)
+            return OrderedDict((name, column) for (name, _, _), column in zip(plan, columns))
+
+        raise ValueError('Unknown output "{output}", expected "dict", "tuple" or "columns"'.format(output=output))
+
+    def get_dump_plan(self):
+        # (field_name, getter, converter) entries where a None converter stands for a primitive value
+        cache = self.get_plan_cache()
+        if "dump" not in cache:
+            fields = self.fields
+            cache["dump"] = [
+                (
+                    field_name,
+                    self.get_dump_getter(fields[field_name], attr),
+                    self.get_dump_converter(fields[field_name]),
+                )
+                for field_name, attr in self.get_representation_plan()
+            ]
+
+        return cache["dump"]
+
+    def get_dump_getter(self, field, attr):
+        if attr is not None:
+            return operator.attrgetter(attr)
+
+        def getter(instance):
+            try:
+                return field.get_attribute(instance)
+            except SkipField:
+                return None
+
+        return getter
+
+    def get_dump_converter(self, field):
+        if isinstance(field, DataclassSerializer):
+            return _nested_dumper(field)
+
+        if isinstance(field, serializers.ListSerializer):
+            child = self.get_dump_converter(field.child)
+            return lambda value: [None if v is None else child(v) for v in value]
+
+        if isinstance(field, fields.DictField):
+            child = self.get_dump_converter(field.child)
+            if child is None:
+                return dict
+            return lambda value: {k: None if v is None else child(v) for k, v in value.items()}
+
+        if isinstance(field, fields.ListField):
+            child = self.get_dump_converter(field.child)
+            if child is None:
+                return list
+            return lambda value: [None if v is None else child(v) for v in value]
+
+        if type(field) in _PRIMITIVE_FIELDS:
+            return None
+
+        return field.to_representation
+
+    def get_validation_plan(self):
+        # (field_name, attribute, optional) entries where a None attribute goes through the DRF path, optional fields
+        # can be missing from the payload
+        cache = self.get_plan_cache()
+        if "validation" not in cache:
+            cache["validation"] = tuple(
+                (
+                    field.field_name,
+                    field.source_attrs[0] if self.is_plain_writable_field(field) else None,
+                    not field.required and field.default is empty,
+                )
+                for field in self._all_fields.values()
+                if not field.read_only
+            )
+
+        return cache["validation"]
+
+    def is_plain_writable_field(self, field):
+        return (
+            self.is_plain_field(field)
+            and "validators" not in field._kwargs
+            and not hasattr(self, "validate_" + field.field_name)
+        )
+
+    @cached_property
+    def _validation_plan(self):
+        # unbuilt fields follow the class plan, fields this instance built or added are looked at as they are now
+        entries = {field_name: (attr, optional) for field_name, attr, optional in self.get_validation_plan()}
+        plan = []
+        for field_name, field in self.fields.fields.items():
+            if isinstance(field, DeferredField):
+                if field_name not in entries:
+                    continue
+                attr, optional = entries[field_name]
+                field = self.get_plan_field(field_name, attr)
+            elif field.read_only:
+                continue
+            else:
+                attr = field.source_attrs[0] if field_name in entries and self.is_plain_writable_field(field) else None
+                optional = not field.required and field.default is empty
+            plan.append([field_name, field, attr, optional])
+        return plan
+
+    def has_read_only_default(self, field):
+        return field.read_only and field.default is not empty and field.source != "*" and "." not in field.source
+
+    def _read_only_defaults(self):
+        # only build the unbuilt fields that can have a default
+        cache = self.get_plan_cache()
+        if "read_only_defaults" not in cache:
+            cache["read_only_defaults"] = frozenset(
+                field.field_name for field in self._all_fields.values() if self.has_read_only_default(field)
+            )
+
+        defaults = {}
+        for field_name, field in self.fields.fields.items():
+            if isinstance(field, DeferredField):
+                if field_name not in cache["read_only_defaults"]:
+                    continue
+                field = self.fields[field_name]
+            elif not self.has_read_only_default(field):
+                continue
+            try:
+                defaults[field.source] = field.get_default()
+            except SkipField:
+                continue
+
+        return defaults
+
+    @instrumented("run_validation")
+    def run_validation(self, data=empty):
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, Mapping):
+            return super().to_internal_value(data)
+
+        # plain dicts are read directly, other mappings such as a QueryDict go through field.get_value()
+        is_dict = type(data) is dict
+        ret = OrderedDict()
+        errors = OrderedDict()
+
+        for entry in self._validation_plan:
+            field_name, field, attr, optional = entry
+            if attr is None or not is_dict:
+                if attr is not None:
+                    field = self.fields[field_name]
+                validate_method = getattr(self, "validate_" + field_name, None)
+                primitive_value = field.get_value(data)
+            else:
+                validate_method = None
+                primitive_value = data.get(field_name, empty)
+                if primitive_value is empty:
+                    if optional:
+                        continue
+                    # missing values depend on the bound field, e.g. for partial updates
+                    field = self.fields[field_name]
+                elif field is None:
+                    field = entry[1] = self.fields[field_name]
+
+            try:
+                validated_value = field.run_validation(primitive_value)
+                if validate_method is not None:
+                    validated_value = _resolve(validate_method(validated_value))
+            except ValidationError as exc:
+                errors[field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field_name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                if attr is None:
+                    self.set_value(ret, field.source_attrs, validated_value)
+                else:
+                    ret[attr] = validated_value
+                continue
+
+            if self.max_errors is not None and len(errors) >= self.max_errors:
+                break
+
+        if errors:
+            raise ValidationError(errors)
 
+        return ret
+
+    def get_options(self):
+        # Meta is read and validated once per class
+        cache = self.get_class_cache()
+        if "options" not in cache:
+            cache["options"] = self.build_options()
+
+        return cache["options"]
+
+    def build_options(self):
         fields = getattr(self.Meta, "fields", None)
         exclude = getattr(self.Meta, "exclude", None)
+        depth = getattr(self.Meta, "depth", 0)
 
         if fields and fields != serializers.ALL_FIELDS and not isinstance(fields, (list, tuple)):
             raise TypeError(
@@ -85,9 +731,10 @@ class DataclassSerializer(serializers.Serializer):
         if exclude and not isinstance(exclude, (list, tuple)):
             raise TypeError("The `exclude` option must be a list or tuple. Got %s." % type(exclude).__name__)
 
-        assert not (fields and exclude), (
-            "Cannot set both 'fields' and 'exclude' options on "
-            "serializer {serializer_class}.".format(serializer_class=self.__class__.__name__)
+        assert not (
+            fields and exclude
+        ), "Cannot set both 'fields' and 'exclude' options on " "serializer {serializer_class}.".format(
+            serializer_class=self.__class__.__name__
         )
 
         assert not (fields is None and exclude is None), (
@@ -96,8 +743,25 @@ class DataclassSerializer(serializers.Serializer):
             "{serializer_class} serializer.".format(serializer_class=self.__class__.__name__),
         )
 
-        if fields == serializers.ALL_FIELDS:
-            fields = None
+        if depth is not None:
+            assert depth >= 0, "'depth' may not be negative."
+            assert depth <= 5, "'depth' may not be greater than 5."
+
+        extra_kwargs = self.get_extra_kwargs()
+
+        return MetaOptions(
+            fields=None if fields is None or fields == serializers.ALL_FIELDS else tuple(fields),
+            exclude=None if exclude is None else tuple(exclude),
+            extra_kwargs=MappingProxyType(
+                {field_name: MappingProxyType(kwargs) for field_name, kwargs in extra_kwargs.items()}
+            ),
+            depth=depth,
+        )
+
+    def get_field_names(self, declared_fields, dataclass_fields):
+        options = self.get_options()
+        fields = options.fields
+        exclude = options.exclude
 
         if fields is not None:
             # Ensure that all declared fields have also been included in the
@@ -116,7 +780,7 @@ class DataclassSerializer(serializers.Serializer):
                     "{serializer_class}, but has not been included in the "
                     "'fields' option.".format(field_name=field_name, serializer_class=self.__class__.__name__)
                 )
-            return fields
+            return list(fields)
 
         # Use the default set of field names if `Meta.fields` is not specified.
         fields = self.get_default_field_names(declared_fields, dataclass_fields)
@@ -146,6 +810,7 @@ class DataclassSerializer(serializers.Serializer):
         return list(dataclass_fields)
 
     def get_extra_kwargs(self):
+        # only called when the MetaOptions are built, use get_options().extra_kwargs instead
         extra_kwargs = copy.deepcopy(getattr(self.Meta, "extra_kwargs", {}))
 
         read_only_fields = getattr(self.Meta, "read_only_fields", None)
@@ -172,103 +837,152 @@ class DataclassSerializer(serializers.Serializer):
     def build_field(self, field_name, dataclass_fields, model, depth):
         field_info = dataclass_fields[field_name]
 
-        for typ in field_info.type.mro():
-            if typ in self.serializer_field_mapping:
-                field_type = self.serializer_field_mapping[typ]
-                return self.build_standard_field(field_type, field_name, field_info)
+        if field_info.container is dict:
+            return DeferredField("build_nested_dict_field", field_name, field_info, depth)
 
-        target_model = field_info.type
-        if getattr(target_model, "__origin__", None) == list:
-            return self.build_nested_list_field(field_name, field_info, depth)
+        if field_info.container is not None:
+            return DeferredField("build_nested_list_field", field_name, field_info, depth)
+
+        field_class = self.get_field_class(field_info.type)
+        if field_class is not None:
+            field = self.build_standard_field(field_class, field_name, field_info)
+            return FieldTemplate(field) if self.is_stateless_field(field) else field
 
-        if getattr(target_model, "__origin__", None) == dict:
-            return self.build_nested_dict_field(field_name, field_info, depth)
+        return DeferredField("build_nested_field", field_name, field_info, depth)
 
-        return self.build_nested_field(field_name, field_info, depth)
+    def get_field_registry(self):
+        # a plain dict serializer_field_mapping is the complete mapping of the serializer class
+        mapping = self.serializer_field_mapping
+        if isinstance(mapping, FieldRegistry):
+            return mapping
+
+        cache = self.get_class_cache()
+        if cache.get("field_registry", (None,))[0] is not mapping:
+            cache["field_registry"] = (mapping, FieldRegistry(mapping))
+
+        return cache["field_registry"][1]
+
+    def get_field_class(self, typ):
+        return self.get_field_registry().lookup(typ)
 
     def build_standard_field(self, field_type, field_name, field_info):
         return field_type(**self.get_kwargs_for_field(field_info))
 
+    def build_child_field(self, field_info, **kwargs):
+        field_class = self.get_field_class(field_info.type)
+        if enum.Enum in getattr(field_info.type, "__mro__", ()):
+            kwargs["choices"] = field_info.type
+        return field_class(**kwargs)
+
     def build_nested_field(self, field_name, field_info, nested_depth):
         target_model = field_info.type
+        assert da.is_dataclass(target_model), "Couldn't find a serializer field for {model}.{field}: {typ!r}".format(
+            model=self.model.__name__, field=field_info.name, typ=field_info.annotation
+        )
 
         nested_serializer = self.build_nested_serializer_class(target_model, nested_depth)
 
-        return type(target_model.__name__ + "Serializer", (nested_serializer,), {})(
-            **self.get_kwargs_for_nested_field(field_info)
-        )
+        return nested_serializer(**self.get_kwargs_for_nested_field(field_info))
 
     def build_nested_list_field(self, field_name, field_info, nested_depth):
         target_model = field_info.type
-        if getattr(target_model, "__origin__", None) == list:
-            assert len(target_model.__args__) == 1, "Nested list fields can only have one generic type"
-            target_model = target_model.__args__[0]
+
+        if target_model is None or self.get_field_class(target_model) is not None:
+            kwargs = self.get_kwargs_for_field(field_info)
+            if target_model is not None:
+                kwargs["child"] = self.build_child_field(field_info, allow_null=field_info.child_nullable)
+            if field_info.container is not list:
+                kwargs["container"] = field_info.container
+                return CollectionField(**kwargs)
+            return fields.ListField(**kwargs)
+
+        assert da.is_dataclass(target_model), "Couldn't find a serializer field for {model}.{field}: {typ!r}".format(
+            model=self.model.__name__, field=field_info.name, typ=field_info.annotation
+        )
 
         kwargs = self.get_kwargs_for_nested_field(field_info)
         kwargs["many"] = True
 
         nested_serializer = self.build_nested_serializer_class(target_model, nested_depth)
-        return type(target_model.__name__ + "Serializer", (nested_serializer,), {})(**kwargs)
+        return nested_serializer(**kwargs)
 
     def build_nested_dict_field(self, field_name, field_info, nested_depth):
         target_model = field_info.type
-        if getattr(target_model, "__origin__", None) == dict:
-            assert len(target_model.__args__) == 2, "Nested dict fields can only have one generic type"
-            assert target_model.__args__[0] is str, "Nested dict key can only be string"
-            target_model = target_model.__args__[1]
 
         kwargs = self.get_kwargs_for_nested_field(field_info)
 
-        child_field = None
-        if target_model in self.serializer_field_mapping:
-            child_field = self.serializer_field_mapping[target_model](allow_null=True)
-        else:
-            child_field = type(
-                target_model.__name__ + "Serializer",
-                (self.build_nested_serializer_class(target_model, nested_depth),),
-                {},
-            )(**kwargs)
+        if target_model is None:
+            return fields.DictField(required=False)
 
-        assert target_model is not None, "Couldn't figure out nested dict value type"
+        if self.get_field_class(target_model) is not None:
+            return fields.DictField(child=self.build_child_field(field_info, allow_null=True), required=False)
+
+        assert da.is_dataclass(target_model), "Couldn't find a serializer field for {model}.{field}: {typ!r}".format(
+            model=self.model.__name__, field=field_info.name, typ=field_info.annotation
+        )
 
+        child_field = self.build_nested_serializer_class(target_model, nested_depth)(**kwargs)
         return fields.DictField(child=child_field, required=False)
 
     def build_nested_serializer_class(self, target_model, nested_depth):
-        class NestedSerializer(self.__class__):
+        # generated classes always derive from the serializer the nesting started from so that
+        # the same (parent, model, depth) combination maps to a single class
+        parent = getattr(self.__class__, "_nested_parent", self.__class__)
+        key = (parent, target_model, max(0, nested_depth - 1))
+
+        nested_serializer = self.nested_serializer_registry.get(key)
+        if nested_serializer is None:
+
             class Meta:
                 model = target_model
                 fields = "__all__"  # TODO: figure out what fields
                 depth = max(0, nested_depth - 1)
+                list_serializer_class = getattr(self.Meta, "list_serializer_class", DataclassListSerializer)
+
+            nested_serializer = type(
+                target_model.__name__ + "Serializer", (parent,), {"Meta": Meta, "_nested_parent": parent}
+            )
+            nested_serializer = self.nested_serializer_registry.add(key, nested_serializer)
 
-        return NestedSerializer
+        return nested_serializer
 
     def get_kwargs_for_field(self, field_info):
-        kwargs = {"required": False}
+        kwargs = {"required": self.is_required(field_info)}
 
-        if enum.Enum in field_info.type.mro():
+        if field_info.nullable:
+            kwargs["allow_null"] = True
+
+        if field_info.container is None and enum.Enum in field_info.type.__mro__:
             kwargs["choices"] = field_info.type
 
-        extra_kwargs = self.get_extra_kwargs()
-        kwargs.update(extra_kwargs.get(field_info.name, {}))
+        kwargs.update(self.get_options().extra_kwargs.get(field_info.name, {}))
 
         return kwargs
 
+    def is_required(self, field_info):
+        return field_info.field.init and not has_default(field_info.field)
+
     def get_kwargs_for_nested_field(self, field_info):
-        kwargs = {"required": False}
+        kwargs = {"required": self.is_required(field_info)}
 
-        extra_kwargs = self.get_extra_kwargs()
-        kwargs.update(extra_kwargs.get(field_info.name, {}))
+        if field_info.nullable:
+            kwargs["allow_null"] = True
+
+        kwargs.update(self.get_options().extra_kwargs.get(field_info.name, {}))
 
         return kwargs
 
     def update_attribute(self, instance, field, value):
-        field_setter = getattr(self, "set_" + field.field_name, None)
-        if field_setter:
-            field_setter(instance, field.source, value)
+        # the update plan resolves the setter of each field up front, an override is called for every field instead
+        setter = self.get_setter_name(field.field_name)
+        if setter:
+            _resolve(getattr(self, setter)(instance, field.source, value))
+        elif is_frozen(self.model):
+            object.__setattr__(instance, field.source, value)
         else:
             setattr(instance, field.source, value)
 
-    def get_object(self, validated_data, instance=None):
+    def get_object(self, validated_data, instance=None, errors=None):
         if validated_data is None:
             instance = None
 
@@ -276,7 +990,18 @@ class DataclassSerializer(serializers.Serializer):
             return instance
 
         elif validated_data is not None and self.allow_create:
-            return self.model()
+            if errors is not None:
+                return self.perform_create(validated_data, errors)
+
+            errors = self.get_error_collector()
+            instance = None
+            try:
+                instance = self.perform_create(validated_data, errors)
+            except TooManyErrors:
+                pass
+            if errors:
+                raise errors.as_validation_error()
+            return instance
 
         elif self.allow_null:
             return
@@ -285,81 +1010,564 @@ class DataclassSerializer(serializers.Serializer):
             raise self.fail("required")
 
     def create(self, validated_data):
-        if self.instance is None:
-            # TODO: figure out required __init__ args here
-            self.instance = self.model()
+        if self.instance is not None:
+            return self.update(self.instance, validated_data)
+
+        errors = self.get_error_collector()
+        instance = None
+        try:
+            instance = self.perform_create(validated_data, errors)
+        except TooManyErrors:
+            pass
+
+        if errors:
+            raise errors.as_validation_error()
 
-        return self.update(self.instance, validated_data)
+        return instance
 
     def update(self, instance, validated_data):
-        errors = {}
-        instance = self.perform_update(instance, validated_data, errors)
+        # frozen dataclasses are copied, with track_changes unchanged attributes are left alone and the records of what
+        # was written end up in self.changes
+        errors = self.get_error_collector()
+        changes = ChangeSet() if self.track_changes else None
+        try:
+            instance = self.perform_update(instance, validated_data, errors, changes)
+        except TooManyErrors:
+            pass
 
         if errors:
-            raise ValidationError(errors)
+            raise errors.as_validation_error()
+
+        if changes is not None:
+            self.changes = changes.changes
 
         return instance
 
-    def perform_update(self, instance, validated_data, errors):
+    def iter_ingest(self, items, errors=None):
+        # yields an instance for each valid item, validation errors are collected in errors keyed by the item index
+        errors = {} if errors is None else errors
 
-        for field in self._writable_fields:
+        for index, item in enumerate(items):
             try:
-                if isinstance(field, DataclassSerializer):
-                    if field.source == "*":
-                        value = validated_data
-                        child_instance = instance
-                    else:
-                        if field.source not in validated_data:
-                            continue
-                        value = validated_data.get(field.source)
-                        child_instance = getattr(instance, field.source, None)
-                        child_instance = field.get_object(value, child_instance)
-
-                    if child_instance:
-                        value = field.perform_update(child_instance, value, errors)
-                    else:
-                        value = child_instance
-
-                elif isinstance(field, fields.DictField) and isinstance(field.child, DataclassSerializer):
-                    value = {}
-                    existing_value = getattr(instance, field.source, []) or {}
-                    for key, item in validated_data.get(field.source, {}).items():
-                        child_instance = field.child.get_object(item, existing_value.get(key))
-                        if child_instance and (field.child.allow_create or field.child.allow_nested_updates):
-                            v = field.child.perform_update(child_instance, item, errors)
-                        else:
-                            v = child_instance
-                        if v:
-                            value[key] = v
-
-                elif isinstance(field, serializers.ListSerializer) and isinstance(field.child, DataclassSerializer):
-                    value = []
-                    existing_value = getattr(instance, field.source, []) or []
-
-                    for item, child_instance in itertools.zip_longest(
-                        validated_data.get(field.source, []), existing_value
-                    ):
-                        child_instance = field.child.get_object(item, child_instance)
-                        if child_instance and (field.child.allow_create or field.child.allow_nested_updates):
-                            v = field.child.perform_update(child_instance, item, errors)
-                        else:
-                            v = child_instance
-
-                        if v:
-                            value.append(v)
+                validated_data = self.run_validation(item)
+                item_errors = ErrorCollector()
+                instance = self.get_object(validated_data, errors=item_errors)
+                if item_errors:
+                    raise item_errors.as_validation_error()
+            except ValidationError as e:
+                errors[index] = e.detail
+                if self.max_errors is not None and len(errors) >= self.max_errors:
+                    return
+            else:
+                yield instance
+
+    def ingest(self, items, consumer, chunk_size=1000):
+        # passes the instances to consumer in lists of at most chunk_size, returns the validation errors by item index
+        errors = {}
+        chunk = []
+
+        for instance in self.iter_ingest(items, errors):
+            chunk.append(instance)
+            if len(chunk) >= chunk_size:
+                consumer(chunk)
+                chunk = []
+
+        if chunk:
+            consumer(chunk)
+
+        return errors
+
+    def get_error_collector(self):
+        return ErrorCollector(max_errors=self.max_errors)
+
+    def get_update_plan(self):
+        # (field_name, handler, setter) entries where setter is the optional set_<field> method
+        cache = self.get_plan_cache()
+        if "update" not in cache:
+            cache["update"] = tuple(
+                (
+                    field.field_name,
+                    self.get_update_handler(field),
+                    self.get_setter_name(field.field_name),
+                )
+                for field in self._all_fields.values()
+                if not field.read_only
+            )
 
-                else:
-                    if field.source not in validated_data:
-                        continue
+        return cache["update"]
+
+    def get_setter_name(self, field_name):
+        name = "set_" + field_name
+        # skip DRF's own set_value helper
+        if hasattr(self, name) and not hasattr(serializers.Serializer, name):
+            return name
+
+    def get_update_handler(self, field):
+        if isinstance(field, DataclassSerializer):
+            return "perform_nested_update"
+
+        if isinstance(field, fields.DictField) and isinstance(field.child, DataclassSerializer):
+            return "perform_nested_dict_update"
+
+        if isinstance(field, serializers.ListSerializer) and isinstance(field.child, DataclassSerializer):
+            return "perform_nested_list_update"
+
+        return "perform_scalar_update"
+
+    @cached_property
+    def _update_plan(self):
+        # unbuilt fields follow the class plan, fields this instance built or added are looked at as they are now
+        entries = {field_name: (handler, setter) for field_name, handler, setter in self.get_update_plan()}
+        attribute_setter = object.__setattr__ if is_frozen(self.model) else setattr
+        plan = []
+        for field_name, field in self.fields.fields.items():
+            if isinstance(field, DeferredField):
+                if field_name not in entries:
+                    continue
+                handler, setter = entries[field_name]
+                field = self.fields[field_name]
+            elif field.read_only:
+                continue
+            else:
+                handler, setter = self.get_update_handler(field), self.get_setter_name(field_name)
+            plan.append((field, getattr(self, handler), getattr(self, setter) if setter else attribute_setter))
+
+        if type(self).update_attribute is DataclassSerializer.update_attribute:
+            return plan
+
+        return [(field, handler, self.get_attribute_updater(field)) for field, handler, _ in plan]
+
+    def get_attribute_updater(self, field):
+        def updater(instance, source, value):
+            self.update_attribute(instance, field, value)
+
+        return updater
+
+    def get_init_fields(self):
+        # __init__ argument names mapped to whether they are required
+        cache = self.get_class_cache()
+        if "init_fields" not in cache:
+            cache["init_fields"] = OrderedDict((f.name, not has_default(f)) for f in da.fields(self.model) if f.init)
+
+        return cache["init_fields"]
+
+    def get_non_init_fields(self):
+        cache = self.get_class_cache()
+        if "non_init_fields" not in cache:
+            cache["non_init_fields"] = tuple(f.name for f in da.fields(self.model) if not f.init)
+
+        return cache["non_init_fields"]
+
+    def match_instances(self, instances, validated_data):
+        # items are matched on match_on through an index of instances when it is set and by position otherwise,
+        # returns (index, key, item, instance) entries and the (key, instance) pairs that were left out
+        if self.match_on is None:
+            return [(i, i) + pair for i, pair in enumerate(itertools.zip_longest(validated_data, instances))], []
+
+        source = self._all_fields[self.match_on].source
+        index = {}
+        for instance in instances:
+            index.setdefault(getattr(instance, source, None), instance)
+        index.pop(None, None)
+
+        pairs = []
+        matched = set()
+        for position, item in enumerate(validated_data):
+            key = item.get(source) if item is not None else None
+            instance = index.pop(key, None) if key is not None else None
+            if instance is not None:
+                matched.add(id(instance))
+            pairs.append((position, position if key is None else key, item, instance))
+
+        removed = [(getattr(instance, source, None), instance) for instance in instances if id(instance) not in matched]
+        return pairs, removed
+
+    @instrumented(
+        "perform_update_many", count_items=lambda instances, validated_data, *args, **kwargs: len(validated_data)
+    )
+    def perform_update_many(self, instances, validated_data, errors, changes=None):
+        can_update = self.allow_create or self.allow_nested_updates
+        ret = []
+
+        pairs, removed = self.match_instances(instances, validated_data)
+        for index, key, item, existing in pairs:
+            instance = self.get_object(item, existing, errors.nested(index))
+            if instance is existing and instance and can_update:
+                instance = self.perform_update(
+                    instance, item, errors.nested(index), changes.nested(key) if changes is not None else None
+                )
+
+            if instance:
+                ret.append(instance)
+
+            if changes is not None and (existing is None) is not (instance is None):
+                changes.add(key, existing, instance)
+
+        if changes is not None:
+            for key, instance in removed:
+                changes.add(key, instance, None)
+
+        return ret
+
+    @instrumented("perform_update", count_errors=lambda instance, validated_data, errors, *args, **kwargs: len(errors))
+    def perform_update(self, instance, validated_data, errors, changes=None):
+        # with changes only the attributes that differ are written, frozen dataclasses are copied with replace()
+        # errors used to be a dict, the collector still supports the setdefault and update calls overrides made on it
+        values = self.get_update_values(instance, validated_data, errors, changes)
+
+        if is_frozen(self.model):
+            kwargs, values = self.split_init_values(values)
+            # only copy the instance when some value actually changed
+            kwargs = {name: value for name, value in kwargs.items() if not _same(getattr(instance, name), value)}
+            if kwargs:
+                replaced = self.build_object(da.replace, errors, instance, **kwargs)
+                if replaced is not None:
+                    # replace() resets them to their defaults, new values are set along with the remaining values
+                    for name in self.get_non_init_fields():
+                        if hasattr(instance, name):
+                            object.__setattr__(replaced, name, getattr(instance, name))
+                    instance = replaced
+
+        return self.set_values(instance, values, errors, changes)
+
+    @cached_property
+    def _create_plan(self):
+        # (source, field, handler, setter, init) entries where a None handler stands for a plain
+        # perform_scalar_update lookup and a None setter for a value that's only passed to __init__, along with the
+        # required __init__ arguments and the dataclass
+        init_fields = self.get_init_fields()
+        scalar = getattr(type(self).perform_scalar_update, "__func__", type(self).perform_scalar_update)
+        plan = [
+            (
+                field.source,
+                field,
+                None if handler.__func__ is scalar and field.source != "*" else handler,
+                None if field.source in init_fields and (setter is setattr or setter is object.__setattr__) else setter,
+                field.source in init_fields,
+            )
+            for field, handler, setter in self._update_plan
+        ]
+        required = [name for name, is_required in init_fields.items() if is_required]
+        return plan, required, self.model
+
+    @instrumented("perform_create", count_errors=lambda validated_data, errors, *args, **kwargs: len(errors))
+    def perform_create(self, validated_data, errors):
+        # a single __init__ call, the fields that aren't __init__ arguments and the __init__ arguments that have a
+        # set_<field> method are set afterwards
+        plan, required, model = self._create_plan
+        kwargs = {}
+        values = []
+
+        for source, field, handler, setter, init in plan:
+            if handler is None:
+                value = validated_data.get(source, empty)
+            elif source == "*":
+                values.append((field, None, validated_data))
+                continue
+            else:
+                try:
+                    value = handler(field, None, validated_data, errors)
+                except DjangoValidationError as e:
+                    errors.add(None, e)
+                    continue
+                except TooManyErrors:
+                    raise
+                except Exception as e:
+                    errors.add(field.field_name, e)
+                    continue
+
+            if value is empty:
+                continue
+            if init:
+                kwargs[source] = value
+            if setter is not None:
+                values.append((field, setter, value))
+
+        if required:
+            missing = [name for name in required if name not in kwargs]
+            for name in missing:
+                errors.add(name, ValidationError(fields.Field.default_error_messages["required"], code="required"))
+            if missing:
+                return None
+
+        instance = self.build_object(model, errors, **kwargs)
+        if instance is None:
+            return None
+
+        return self.set_values(instance, values, errors) if values else instance
+
+    def build_object(self, factory, errors, *args, **kwargs):
+        try:
+            return factory(*args, **kwargs)
+        except DjangoValidationError as e:
+            errors.add(None, e)
+        except Exception as e:
+            errors.add(api_settings.NON_FIELD_ERRORS_KEY, e)
+
+    def get_update_values(self, instance, validated_data, errors, changes=None):
+        # instance is None when a new instance is being created
+        values = []
+
+        for field, handler, setter in self._update_plan:
+            if field.source == "*":
+                # source="*" serializers update the instance itself once it exists
+                values.append((field, None, validated_data))
+                continue
+
+            try:
+                value = handler(field, instance, validated_data, errors, changes)
+                if value is not empty:
+                    values.append((field, setter, value))
 
-                    value = validated_data.get(field.source)
+            except DjangoValidationError as e:
+                errors.add(None, e)
+
+            except TooManyErrors:
+                raise
+
+            except Exception as e:
+                errors.add(field.field_name, e)
+
+        return values
 
-                self.update_attribute(instance, field, value)
+    def split_init_values(self, values):
+        init_fields = self.get_init_fields()
+        kwargs = {}
+        rest = []
+
+        for entry in values:
+            field, setter, value = entry
+            if (setter is setattr or setter is object.__setattr__) and field.source in init_fields:
+                kwargs[field.source] = value
+            else:
+                rest.append(entry)
+
+        return kwargs, rest
+
+    def set_values(self, instance, values, errors, changes=None):
+        for field, setter, value in values:
+            try:
+                if setter is None:
+                    if changes is None:
+                        instance = field.perform_update(instance, value, errors)
+                    else:
+                        instance = field.perform_update(instance, value, errors, changes)
+                else:
+                    result = setter(instance, field.source, value)
+                    if result is not None:
+                        _resolve(result)
 
             except DjangoValidationError as e:
-                errors.update(django_to_drf_validation_error(e).detail)
+                errors.add(None, e)
+
+            except TooManyErrors:
+                raise
 
             except Exception as e:
-                errors.setdefault(field.field_name, []).append(" ".join(map(str, e.args)))
+                errors.add(field.field_name, e)
 
         return instance
+
+    def perform_scalar_update(self, field, instance, validated_data, errors, changes=None):
+        value = validated_data.get(field.source, empty)
+
+        if changes is not None and value is not empty:
+            old = getattr(instance, field.source, None)
+            if _same(old, value):
+                return empty
+            changes.add(field.field_name, old, value)
+
+        return value
+
+    def perform_nested_update(self, field, instance, validated_data, errors, changes=None):
+        if field.source not in validated_data:
+            return empty
+
+        value = validated_data.get(field.source)
+        existing = getattr(instance, field.source, None)
+        nested_errors = errors.nested(field.field_name)
+        child_instance = field.get_object(value, existing, nested_errors)
+
+        if child_instance is existing and child_instance:
+            child_instance = field.perform_update(
+                child_instance,
+                value,
+                nested_errors,
+                changes.nested(field.field_name) if changes is not None else None,
+            )
+
+        if changes is not None:
+            if child_instance is existing:
+                return empty
+            if (existing is None) is not (child_instance is None):
+                changes.add(field.field_name, existing, child_instance)
+
+        return child_instance
+
+    def perform_nested_dict_update(self, field, instance, validated_data, errors, changes=None):
+        if field.source not in validated_data and self.root.partial:
+            return empty
+
+        child = field.child
+        can_update = child.allow_create or child.allow_nested_updates
+        nested_errors = errors.nested(field.field_name)
+        nested_changes = changes.nested(field.field_name) if changes is not None else None
+
+        value = {}
+        data = validated_data.get(field.source, {})
+        existing_value = getattr(instance, field.source, None) or {}
+        for key, item in data.items():
+            existing = existing_value.get(key)
+            v = child.get_object(item, existing, nested_errors.nested(key))
+            if v is existing and v and can_update:
+                v = child.perform_update(
+                    v,
+                    item,
+                    nested_errors.nested(key),
+                    nested_changes.nested(key) if nested_changes is not None else None,
+                )
+            if v:
+                value[key] = v
+
+            if nested_changes is not None and (existing is None) is not (v is None):
+                nested_changes.add(key, existing, v)
+
+        if nested_changes is not None:
+            for key, existing in existing_value.items():
+                if key not in data:
+                    nested_changes.add(key, existing, None)
+
+            if value.keys() == existing_value.keys() and all(v is existing_value[k] for k, v in value.items()):
+                return empty
+
+        return value
+
+    def perform_nested_list_update(self, field, instance, validated_data, errors, changes=None):
+        if field.source not in validated_data and self.root.partial:
+            return empty
+
+        existing_value = getattr(instance, field.source, None) or []
+        value = field.child.perform_update_many(
+            existing_value,
+            validated_data.get(field.source, []),
+            errors.nested(field.field_name),
+            changes.nested(field.field_name) if changes is not None else None,
+        )
+
+        if changes is not None and len(value) == len(existing_value):
+            if all(v is e for v, e in zip(value, existing_value)):
+                return empty
+            if {id(v) for v in value} == {id(e) for e in existing_value}:
+                # same items in a new order
+                changes.add(field.field_name, list(existing_value), value)
+
+        field_info = get_field_info(self.model).get(field.source)
+        if field_info is not None and field_info.container not in (None, list):
+            value = field_info.container(value)
+
+        return value
+
+
+class _UnvalidatedList(list):
+    # hides the items from ListSerializer.to_internal_value so that it only checks the list itself
+
+    def __iter__(self):
+        return iter(())
+
+
+class DataclassListSerializer(AsyncSerializerMixin, serializers.ListSerializer):
+    # max_errors and fail_fast only cut list validation short with this list class, which nested lists use by
+    # default while top level many=True serializers use DRF's ListSerializer
+
+    changes = None
+
+    def iter_representation(self, iterable):
+        return self.child.iter_representation(iterable)
+
+    def aiter_representation(self, iterable, chunk_size=100):
+        return self.child.aiter_representation(iterable, chunk_size=chunk_size)
+
+    @instrumented("run_validation_many", count_items=count_first)
+    def run_validation(self, data=empty):
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        if type(data) is not list:
+            return super().to_internal_value(data)
+
+        # the base class checks the list, the items are validated here so that validation can stop after max_errors
+        # invalid items with any DRF version
+        super().to_internal_value(_UnvalidatedList(data))
+
+        ret = []
+        errors = OrderedDict()
+        max_errors = self.child.max_errors
+        results = self.iter_validation_results(data)
+        try:
+            for index, (valid, value) in enumerate(results):
+                if valid:
+                    ret.append(value)
+                    continue
+
+                errors[index] = value
+                if max_errors is not None and len(errors) >= max_errors:
+                    break
+        finally:
+            results.close()
+
+        if errors:
+            if not list_errors_as_dict():
+                errors = [errors.get(index, {}) for index in range(len(data))]
+            raise ValidationError(errors)
+
+        return ret
+
+    def iter_validation_results(self, items):
+        # yields (valid, validated data or error detail) pairs
+        for item in items:
+            try:
+                yield True, self.run_child_validation(item)
+            except ValidationError as e:
+                yield False, e.detail
+
+    def run_child_validation(self, data):
+        return self.child.run_validation(data)
+
+    @instrumented("to_representation_many", count_items=count_first)
+    def to_representation(self, data):
+        return super().to_representation(data)
+
+    def iter_ingest(self, errors=None):
+        # streaming counterpart of is_valid() and save() over initial_data
+        return self.child.iter_ingest(self.initial_data, errors)
+
+    def ingest(self, consumer, chunk_size=1000):
+        return self.child.ingest(self.initial_data, consumer, chunk_size=chunk_size)
+
+    def create(self, validated_data):
+        return self.create_many(validated_data)
+
+    def update(self, instance, validated_data):
+        return self.update_many(instance, validated_data)
+
+    def create_many(self, validated_data):
+        return self.perform_update_many([], validated_data)
+
+    def update_many(self, instances, validated_data):
+        return self.perform_update_many(instances, validated_data)
+
+    def perform_update_many(self, instances, validated_data):
+        errors = self.child.get_error_collector()
+        changes = ChangeSet() if self.child.track_changes else None
+        try:
+            instances = self.child.perform_update_many(instances, validated_data, errors, changes)
+        except TooManyErrors:
+            pass
+
+        if errors:
+            raise errors.as_validation_error()
+
+        if changes is not None:
+            self.changes = changes.changes
+
+        return instances
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming helpers for serializing large collections of dataclasses without materializing the whole payload.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+import codecs
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.json import strict_constant
+
+_DELIMITERS = frozenset(",] \t\n\r")
+
+
+def iter_json_array(stream, encoding="utf-8", chunk_size=64 * 1024, decoder=None):
+    """
+    Incrementally parses a JSON array from the byte ``stream`` yielding one item at a time, only the unparsed tail of
+    the input is kept in memory.
+
+    >>> import io
+    >>> list(iter_json_array(io.BytesIO(b'[1, {"a": [2]}, "b"]'), chunk_size=2))
+    [1, {'a': [2]}, 'b']
+    """
+    decoder = decoder or json.JSONDecoder()
+    reader = codecs.getreader(encoding)(stream)
+    buffer, pos, eof = "", 0, False
+    state, size = "start", chunk_size
+
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+
+        if pos < len(buffer):
+            char = buffer[pos]
+
+            if state == "end":
+                raise ParseError("JSON parse error - unexpected data after the array")
+
+            if state == "start":
+                if char != "[":
+                    raise ParseError("JSON parse error - expected an array")
+                pos += 1
+                state = "first"
+                continue
+
+            if char == "]" and state in ("first", "next"):
+                pos += 1
+                state = "end"
+                continue
+
+            if state == "next":
+                if char != ",":
+                    raise ParseError("JSON parse error - expected ',' or ']' after an array item")
+                pos += 1
+                state = "item"
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                end = None
+
+            # an item is only accepted once the delimiter following it was read since numbers can be split
+            # between two reads
+            if end is not None and (eof or (end < len(buffer) and buffer[end] in _DELIMITERS)):
+                pos = end
+                state, size = "next", chunk_size
+                yield item
+                continue
+
+        if eof:
+            if state == "end":
+                return
+            raise ParseError(
+                "JSON parse error - unexpected end of data" if pos == len(buffer) else "JSON parse error - invalid item"
+            )
+
+        if pos < len(buffer):
+            # the pending item is decoded again after every read, growing the reads keeps large items linear
+            size *= 2
+        chunk = reader.read(size)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    JSON renderer which can render an iterable of items as a JSON array one item at a time, see :meth:`iter_render`.
+    """
+
+    chunk_size = 64 * 1024
+
+    def iter_render(self, items, accepted_media_type=None, renderer_context=None, chunk_size=None):
+        """
+        Renders ``items`` as a JSON array yielding encoded chunks of roughly ``chunk_size`` bytes.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        buffer = bytearray(b"[")
+        separator = b""
+
+        for item in items:
+            buffer += separator
+            buffer += self.render(item, accepted_media_type, renderer_context) if item is not None else b"null"
+            separator = b","
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]"
+        yield bytes(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Streams ``items``, typically ``serializer.iter_representation(instances)``, as a JSON array.
+    """
+
+    def __init__(self, items, renderer=None, chunk_size=None, content_type=None, **kwargs):
+        renderer = renderer or StreamingJSONRenderer()
+        super().__init__(
+            renderer.iter_render(items, chunk_size=chunk_size),
+            content_type=content_type or renderer.media_type,
+            **kwargs
+        )
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    Parses a JSON array request body lazily, ``request.data`` is a generator of the array items.
+    """
+
+    chunk_size = 64 * 1024
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        decoder = json.JSONDecoder(parse_constant=strict_constant if self.strict else None)
+        return iter_json_array(stream, encoding=encoding, chunk_size=self.chunk_size, decoder=decoder)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections import OrderedDict
+
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError as DjangoValidationError
 
-from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
 
 
@@ -26,7 +27,39 @@ def _django_to_drf(e):
     return e
 
 
-def django_to_drf_validation_error(e):
-    return ValidationError(
-        _django_to_drf(e) if hasattr(e, "error_dict") else {api_settings.NON_FIELD_ERRORS_KEY: e.messages}
-    )
+def list_errors_as_dict():
+    # older DRF releases have no such setting and always report list errors as lists
+    try:
+        return api_settings.LIST_SERIALIZER_ERRORS_AS_DICT
+    except AttributeError:
+        return api_settings.user_settings.get("LIST_SERIALIZER_ERRORS_AS_DICT", False)
+
+
+def django_to_drf_error_detail(e):
+    return _django_to_drf(e) if hasattr(e, "error_dict") else {api_settings.NON_FIELD_ERRORS_KEY: e.messages}
+
+
+def parse_field_paths(paths):
+    """
+    Parses dotted field paths into a tree of ``{name: subtree}`` where a ``None`` subtree stands for the whole field.
+
+    >>> parse_field_paths(["id", "lines.a.x", "lines.b"])
+    OrderedDict([('id', None), ('lines', OrderedDict([('a', OrderedDict([('x', None)])), ('b', None)]))])
+    """
+    if paths is None:
+        return None
+
+    if isinstance(paths, str):
+        paths = paths.split(",")
+
+    tree = OrderedDict()
+    for path in paths:
+        name, _, rest = path.strip().partition(".")
+        if name in tree and tree[name] is None:
+            continue
+        if rest:
+            tree.setdefault(name, []).append(rest)
+        else:
+            tree[name] = None
+
+    return OrderedDict((name, parse_field_paths(rest)) for name, rest in tree.items())
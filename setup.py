@@ -36,11 +36,11 @@ setup(
     author=about["__author__"],
     author_email=about["__author_email__"],
     description=about["__description__"],
-    install_requires=["django", "djangorestframework", "django-rest-enumfield"],
+    install_requires=["asgiref", "django", "djangorestframework", "django-rest-enumfield"],
     license="MIT",
     long_description=read("README.rst"),
     name="django-rest-dataclasses",
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=["tests", "benchmarks"]),
     url="https://github.com/shosca/django-rest-dataclasses",
     version=about["__version__"],
     keywords="dataclasses django rest framework drf rest_framework",
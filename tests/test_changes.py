@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.test import SimpleTestCase
+
+from rest_dataclasses.changes import Change, ChangeSet
+
+
+class TestChangeSet(SimpleTestCase):
+    def test_nested(self):
+        changes = ChangeSet()
+        changes.add("name", None, "shosca")
+        lines = changes.nested("lines")
+        lines.nested(0).add("x", 1, 2)
+
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(list(changes), [Change("name", None, "shosca"), Change("lines.0.x", 1, 2)])
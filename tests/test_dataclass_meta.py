@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, annotations, print_function, unicode_literals
+import dataclasses as da
+import sys
+import unittest
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from rest_dataclasses.dataclass_meta import get_field_info
+
+
+@da.dataclass
+class Point:
+    x: int = 0
+    y: Optional[int] = None
+
+
+@da.dataclass
+class Shape:
+    points: List[Point] = da.field(default_factory=list)
+    maybe_points: Optional[List[Optional[Point]]] = None
+    tags: Set[str] = da.field(default_factory=set)
+    labels: FrozenSet[str] = frozenset()
+    coords: Tuple[int, ...] = ()
+    pair: Tuple[int, int] = (0, 0)
+    mixed: Tuple[int, str] = (0, "")
+    names: Dict[str, str] = da.field(default_factory=dict)
+    anything: list = da.field(default_factory=list)
+    children: List[Shape] = da.field(default_factory=list)
+
+
+class TestGetFieldInfo(unittest.TestCase):
+    def test_cached(self):
+        self.assertIs(get_field_info(Point), get_field_info(Point))
+
+    def test_scalars(self):
+        info = get_field_info(Point)
+
+        self.assertEqual(list(info), ["x", "y"])
+        self.assertEqual((info["x"].type, info["x"].nullable, info["x"].container), (int, False, None))
+        self.assertEqual((info["y"].type, info["y"].nullable, info["y"].container), (int, True, None))
+        self.assertEqual(info["y"].annotation, Optional[int])
+        self.assertIs(info["y"].field, da.fields(Point)[1])
+
+    def test_containers(self):
+        info = get_field_info(Shape)
+
+        self.assertEqual(
+            {name: (i.type, i.nullable, i.container, i.child_nullable) for name, i in info.items()},
+            {
+                "points": (Point, False, list, False),
+                "maybe_points": (Point, True, list, True),
+                "tags": (str, False, set, False),
+                "labels": (str, False, frozenset, False),
+                "coords": (int, False, tuple, False),
+                "pair": (int, False, tuple, False),
+                "mixed": (None, False, tuple, False),
+                "names": (str, False, dict, False),
+                "anything": (None, False, list, False),
+                "children": (Shape, False, list, False),
+            },
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 10), "PEP 604 unions need python 3.10")
+    def test_pep_604(self):
+        @da.dataclass
+        class Model:
+            x: int | None = None
+            y: None | list[int] = None
+
+        info = get_field_info(Model)
+
+        self.assertEqual((info["x"].type, info["x"].nullable, info["x"].container), (int, True, None))
+        self.assertEqual((info["y"].type, info["y"].nullable, info["y"].container), (int, True, list))
+
+    def test_unsupported(self):
+        @da.dataclass
+        class Unresolved:
+            x: Missing = None  # noqa
+
+        @da.dataclass
+        class PartlyResolved(Point):
+            a: int = None
+            b: Missing = None  # noqa
+
+        @da.dataclass
+        class MultiUnion:
+            x: Union[int, str] = None
+
+        @da.dataclass
+        class IntKeys:
+            x: Dict[int, str] = None
+
+        with self.assertRaisesRegex(AssertionError, "Could not resolve the annotation 'Missing' of Unresolved.x"):
+            get_field_info(Unresolved)
+
+        with self.assertRaisesRegex(AssertionError, "Could not resolve the annotation 'Missing' of PartlyResolved.b"):
+            get_field_info(PartlyResolved)
+
+        with self.assertRaisesRegex(AssertionError, "Union annotations other than Optional"):
+            get_field_info(MultiUnion)
+
+        with self.assertRaisesRegex(AssertionError, "Nested dict key can only be string"):
+            get_field_info(IntKeys)
+
+        with self.assertRaisesRegex(AssertionError, "is not a dataclass"):
+            get_field_info(int)
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework.exceptions import ValidationError
+
+from rest_dataclasses.errors import ErrorCollector, TooManyErrors
+from rest_dataclasses.serializers import DataclassListSerializer, DataclassSerializer
+
+from .test_serializers import Geometry, Line, Point, User
+
+
+@override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+class TestErrorCollector(SimpleTestCase):
+    def test_as_dict(self):
+        errors = ErrorCollector()
+        lines = errors.nested("lines")
+        lines.nested(0).add("a", ValueError("Bad", 1))
+        lines.nested(0).add("a", "Worse")
+        lines.nested(1).add(None, DjangoValidationError({"b": ["Missing"]}))
+        errors.add(None, DjangoValidationError("Broken"))
+
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(
+            errors.as_dict(),
+            {"lines": {0: {"a": ["Bad 1", "Worse"]}, 1: {"b": ["Missing"]}}, "non_field_errors": ["Broken"]},
+        )
+        self.assertIsInstance(errors.as_validation_error(), ValidationError)
+
+    def test_conflicting_paths(self):
+        errors = ErrorCollector()
+        errors.add("lines", "Bad lines")
+        errors.nested("lines").add("a", "Bad a")
+
+        self.assertEqual(errors.as_dict(), {"lines": {"non_field_errors": ["Bad lines"], "a": ["Bad a"]}})
+
+    def test_max_errors(self):
+        errors = ErrorCollector(max_errors=2)
+        errors.add("a", "Bad")
+
+        with self.assertRaises(TooManyErrors):
+            errors.nested("b").add("c", "Bad")
+
+        self.assertEqual(errors.as_dict(), {"a": ["Bad"], "b": {"c": ["Bad"]}})
+
+    def test_nested_detail(self):
+        errors = ErrorCollector()
+        errors.add("a", ValidationError({"x": ["Bad x"]}))
+        errors.add("a", ValidationError({"x": ["Worse x"], "y": ["Bad y"]}))
+        errors.nested("b").add("x", "Bad x")
+        errors.add("b", "Bad b")
+
+        self.assertEqual(
+            errors.as_dict(),
+            {"a": {"x": ["Bad x", "Worse x"], "y": ["Bad y"]}, "b": {"x": ["Bad x"], "non_field_errors": ["Bad b"]}},
+        )
+
+    def test_dict_methods(self):
+        errors = ErrorCollector().nested("a")
+        errors.setdefault("x", []).append("Bad x")
+        errors.update({"y": ["Bad y"]})
+
+        self.assertEqual(errors.as_dict(), {"a": {"x": ["Bad x"], "y": ["Bad y"]}})
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": False})
+    def test_as_lists(self):
+        errors = ErrorCollector()
+        errors.nested("lines").nested(2).add("a", "Bad")
+        errors.nested("points").add("x", "Bad")
+
+        self.assertEqual(errors.as_dict(), {"lines": [{}, {}, {"a": ["Bad"]}], "points": {"x": ["Bad"]}})
+
+
+@override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+class TestUpdateErrors(SimpleTestCase):
+    def test_nested_paths(self):
+        class PointSerializer(DataclassSerializer):
+            class Meta:
+                model = Point
+                fields = "__all__"
+
+            def set_x(self, instance, field_name, value):
+                raise ValueError("Bad x", value)
+
+        class LineSerializer(DataclassSerializer):
+            a = PointSerializer(required=False)
+            b = PointSerializer(required=False)
+
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+        class Serializer(DataclassSerializer):
+            lines = LineSerializer(many=True)
+
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        serializer = Serializer(data={"lines": [{"a": {"x": 1}}, {"b": {"x": 2}}]})
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {"lines": {0: {"a": {"x": ["Bad x 1"]}}, 1: {"b": {"x": ["Bad x 2"]}}}})
+
+    def test_max_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+            def get_error_collector(self):
+                return ErrorCollector(max_errors=2)
+
+            def set_id(self, instance, field_name, value):
+                saved.append(value)
+
+            def set_name(self, instance, field_name, value):
+                raise ValueError("Bad")
+
+        saved = []
+        serializer = Serializer(data=[{"id": i, "name": "shosca"} for i in range(10)], many=True)
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {0: {"name": ["Bad"]}, 1: {"name": ["Bad"]}})
+        self.assertEqual(saved, [0, 1])
+
+
+@override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+class TestFailFast(SimpleTestCase):
+    def test_validation(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        serializer = Serializer(data={"lines": "bad", "color": "PINK"}, fail_fast=True)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors), ["lines"])
+
+    def test_many(self):
+        validated = []
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+            def validate_name(self, value):
+                validated.append(value)
+                return value
+
+        data = [{"id": i if i % 2 else "bad", "name": str(i)} for i in range(10)]
+        serializer = Serializer(data=data, many=True, max_errors=2)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {0: {"id": ["A valid integer is required."]}, 2: {"id": ["A valid integer is required."]}},
+        )
+        self.assertEqual(validated, ["0", "1", "2"])
+
+        serializer = Serializer(data=data[1::2], many=True, max_errors=2)
+        self.assertTrue(serializer.is_valid())
+
+    def test_list_checks(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        serializer = Serializer(data=[], many=True, allow_empty=False)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {"non_field_errors": ["This list may not be empty."]})
+
+        with override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": False}):
+            serializer = Serializer(data=[{"id": "a"}, {"id": 1}, {"id": "b"}, {"id": "c"}], many=True, max_errors=2)
+            self.assertFalse(serializer.is_valid())
+
+        self.assertEqual(
+            serializer.errors,
+            [{"id": ["A valid integer is required."]}, {}, {"id": ["A valid integer is required."]}, {}],
+        )
+
+    def test_save(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+            def set_name(self, instance, field_name, value):
+                raise ValueError("Bad")
+
+        serializer = Serializer(data=[{"name": "shosca"}, {"name": "sherlock"}], many=True, fail_fast=True)
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {0: {"name": ["Bad"]}})
+
+    def test_create_and_update(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+            def set_x(self, instance, field_name, value):
+                raise ValueError("Bad x")
+
+        serializer = Serializer(data={"a": {"x": 1}, "b": {"x": 2}}, max_errors=1)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+        self.assertEqual(e.exception.detail, {"a": {"x": ["Bad x"]}})
+
+        serializer = Serializer(Line(a=Point(), b=Point()), data={"a": {"x": 1}, "b": {"x": 2}}, max_errors=1)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+        self.assertEqual(e.exception.detail, {"a": {"x": ["Bad x"]}})
+
+        with self.assertRaises(ValidationError) as e:
+            Serializer(max_errors=1).get_object({"a": {"x": 1}, "b": {"x": 2}})
+        self.assertEqual(e.exception.detail, {"a": {"x": ["Bad x"]}})
+        self.assertEqual(Serializer().get_object({"a": {"y": 1}}), Line(a=Point(y=1)))
+
+    def test_star_source(self):
+        class UserSerializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = ("name", "email")
+
+            def update_attribute(self, instance, field, value):
+                raise ValueError("Bad " + field.field_name)
+
+        class Serializer(DataclassSerializer):
+            user = UserSerializer(source="*")
+
+            class Meta:
+                model = User
+                fields = ("id", "user")
+
+        serializer = Serializer(data={"id": 1, "user": {"name": "shosca", "email": "some@email.com"}}, max_errors=1)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+        self.assertEqual(e.exception.detail, {"name": ["Bad name"]})
+
+    def test_handler_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+            def perform_nested_update(self, field, instance, validated_data, errors, changes=None):
+                raise DjangoValidationError({field.field_name: ["Worse"]})
+
+        serializer = Serializer(Line(a=Point(), b=Point()), data={"a": {"x": 1}, "b": {"x": 2}})
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+        self.assertEqual(e.exception.detail, {"a": ["Worse"], "b": ["Worse"]})
+
+    def test_ingest(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        consumed = []
+        errors = Serializer(max_errors=2).ingest([{"id": "a"}, {"id": 1}, {"id": "b"}, {"id": 2}], consumed.extend)
+
+        self.assertEqual(list(errors), [0, 2])
+        self.assertEqual(consumed, [User(id=1)])
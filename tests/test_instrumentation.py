@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.test import SimpleTestCase
+
+from rest_dataclasses import instrumentation
+from rest_dataclasses.instrumentation import Aggregator, add_hook, instrument, remove_hook
+from rest_dataclasses.serializers import DataclassListSerializer, DataclassSerializer
+
+from .test_serializers import Color, Geometry, Line, Point, User
+
+
+class GeometrySerializer(DataclassSerializer):
+    class Meta:
+        model = Geometry
+        fields = "__all__"
+
+
+class TestInstrumentation(SimpleTestCase):
+    def test_hooks(self):
+        events = []
+        add_hook(events.append)
+        try:
+            GeometrySerializer(Geometry(lines=[Line(a=Point(x=1))], color=Color.RED)).data
+        finally:
+            remove_hook(events.append)
+
+        self.assertEqual(instrumentation.hooks, [])
+        self.assertEqual(
+            [(e.phase, e.path) for e in events if e.phase.startswith("to_representation")],
+            [
+                ("to_representation", "lines.a"),
+                ("to_representation", "lines"),
+                ("to_representation_many", "lines"),
+                ("to_representation", ""),
+            ],
+        )
+        self.assertTrue(all(e.duration >= 0 for e in events))
+
+    def test_aggregator(self):
+        serializer = GeometrySerializer(data={"lines": [{"a": {"x": 1}}, {"a": {"x": 2}}], "color": "RED"})
+
+        with instrument(Aggregator()) as aggregator:
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        stats = aggregator.stats
+        self.assertEqual(stats[("run_validation", "")].calls, 1)
+        self.assertEqual(stats[("run_validation_many", "lines")].items, 2)
+        self.assertEqual(stats[("run_validation", "lines")].calls, 2)
+        self.assertEqual(stats[("run_validation", "lines.a")].calls, 2)
+        self.assertEqual(stats[("perform_update_many", "lines")].items, 2)
+        self.assertEqual(stats[("perform_create", "lines")].calls, 2)
+        self.assertEqual(aggregator.most_expensive(1)[0][1].calls, 1)
+
+        self.assertRegex(
+            repr(stats[("run_validation", "")]),
+            r"<Stats calls=1 duration=[0-9.]+ max_duration=[0-9.]+ items=1 errors=0>",
+        )
+
+        aggregator.reset()
+        self.assertEqual(aggregator.stats, {})
+
+    def test_count_first(self):
+        self.assertEqual(instrumentation.count_first([1, 2]), 2)
+        self.assertEqual(instrumentation.count_first(iter([1, 2])), 0)
+
+    def test_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+            def set_name(self, instance, field_name, value):
+                raise ValueError("Bad")
+
+        with instrument(Aggregator()) as aggregator:
+            serializer = Serializer(data=[{"id": "a"}, {"id": 1}], many=True)
+            self.assertFalse(serializer.is_valid())
+
+            serializer = Serializer(data=[{"name": "shosca"}, {"id": 1}], many=True)
+            serializer.is_valid(raise_exception=True)
+            with self.assertRaises(Exception):
+                serializer.save()
+
+        stats = aggregator.stats
+        self.assertEqual(stats[("run_validation_many", "")].errors, 1)
+        self.assertEqual(stats[("run_validation", "")].errors, 1)
+        self.assertEqual(stats[("perform_create", "")].calls, 2)
+        self.assertEqual(stats[("perform_create", "")].errors, 1)
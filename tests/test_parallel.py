@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+import dataclasses as da
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework.exceptions import ValidationError
+
+from rest_dataclasses.parallel import ParallelListSerializer
+from rest_dataclasses.serializers import DataclassListSerializer, DataclassSerializer
+
+from .test_serializers import Color, Geometry, Line, Point
+
+
+@da.dataclass
+class Account:
+    id: int
+    name: str
+    email: str = None
+
+    def __post_init__(self):
+        if self.name == "root":
+            raise ValueError("No root")
+
+
+class AccountSerializer(DataclassSerializer):
+    class Meta:
+        model = Account
+        fields = "__all__"
+        list_serializer_class = ParallelListSerializer
+
+
+class GeometrySerializer(DataclassSerializer):
+    class Meta:
+        model = Geometry
+        fields = "__all__"
+        list_serializer_class = ParallelListSerializer
+
+
+class SerialAccountSerializer(AccountSerializer):
+    class Meta(AccountSerializer.Meta):
+        list_serializer_class = DataclassListSerializer
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def accounts(count):
+    return [{"id": i, "name": "account {}".format(i)} for i in range(count)]
+
+
+class TestParallelListSerializer(SimpleTestCase):
+    def setUp(self):
+        self.executor = CountingExecutor()
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def serializer(self, data, serializer_class=AccountSerializer, **kwargs):
+        serializer = serializer_class(data=data, many=True, **kwargs)
+        serializer.executor = self.executor
+        serializer.chunk_size = 3
+        return serializer
+
+    def test_create(self):
+        serializer = self.serializer(accounts(10))
+        serializer.is_valid(raise_exception=True)
+        instances = serializer.save()
+
+        expected = SerialAccountSerializer(data=accounts(10), many=True)
+        expected.is_valid(raise_exception=True)
+        self.assertEqual(serializer.validated_data, expected.validated_data)
+        self.assertEqual(instances, expected.save())
+        self.assertEqual(self.executor.submitted, 8)
+
+    def test_nested(self):
+        data = [{"color": "RED", "lines": [{"a": {"x": i}}, {"b": {"y": i}}]} for i in range(7)]
+        serializer = self.serializer(data, GeometrySerializer)
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(
+            serializer.save(),
+            [Geometry(color=Color.RED, lines=[Line(a=Point(x=i)), Line(b=Point(y=i))]) for i in range(7)],
+        )
+        self.assertEqual(self.executor.submitted, 6)
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_errors(self):
+        data = accounts(10)
+        data[1]["id"] = "a"
+        data[7] = "bad"
+        data[8]["name"] = "root"
+
+        serializer = self.serializer(data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {
+                1: {"id": ["A valid integer is required."]},
+                7: {"non_field_errors": ["Invalid data. Expected a dictionary, but got str."]},
+            },
+        )
+
+        del data[7], data[1]
+        serializer = self.serializer(data)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as ctx:
+            serializer.save()
+        self.assertEqual(ctx.exception.detail, {6: {"non_field_errors": ["No root"]}})
+
+    def test_max_errors(self):
+        data = [{"id": "a", "name": "account"} for _ in range(10)]
+
+        serializer = self.serializer(data, max_errors=2)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors), [0, 1])
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_create_max_errors(self):
+        data = accounts(10)
+        for index in (0, 1, 4, 5):
+            data[index]["name"] = "root"
+
+        serializer = self.serializer(data, max_errors=2)
+        serializer.is_valid(raise_exception=True)
+        with self.assertRaises(ValidationError) as ctx:
+            serializer.save()
+        self.assertEqual(
+            ctx.exception.detail, {0: {"non_field_errors": ["No root"]}, 1: {"non_field_errors": ["No root"]}}
+        )
+
+    def test_selected_fields(self):
+        data = [dict(item, email="some@email.com") for item in accounts(10)]
+        serializer = self.serializer(data, fields=["id", "name"])
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(serializer.validated_data, accounts(10))
+        self.assertEqual(self.executor.submitted, 4)
+
+    def test_workers_validate(self):
+        serializer = self.serializer(accounts(10))
+        with mock.patch.object(DataclassListSerializer, "run_child_validation", side_effect=AssertionError):
+            serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(len(serializer.validated_data), 10)
+        self.assertEqual(self.executor.submitted, 4)
+
+    def test_serial(self):
+        serializer = self.serializer(accounts(3))
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        # nested lists are validated by the workers of their root
+        with mock.patch.multiple(ParallelListSerializer, executor=self.executor, chunk_size=1):
+            serializer = GeometrySerializer(data={"lines": [{"a": {"x": i}} for i in range(10)]})
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        self.assertEqual(self.executor.submitted, 0)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            # views put the request and the view in the context, neither can be pickled
+            serializer = AccountSerializer(data=accounts(10), many=True, context={"request": threading.Lock()})
+            serializer.executor = executor
+            serializer.chunk_size = 4
+            serializer.is_valid(raise_exception=True)
+            instances = serializer.save()
+
+        self.assertEqual(instances, [Account(id=i, name="account {}".format(i)) for i in range(10)])
+
+    def test_worker_context(self):
+        lock = threading.Lock()
+        serializer = AccountSerializer(data=accounts(10), many=True, context={"lock": lock, "source": "import"})
+
+        self.assertEqual(serializer.get_worker_context(), {"source": "import"})
+        self.assertEqual(serializer.get_worker_kwargs()["context"], {"source": "import"})
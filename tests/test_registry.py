@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+import dataclasses as da
+import enum
+import uuid
+from pathlib import Path, PosixPath
+from typing import Dict, List
+
+from django.test import SimpleTestCase
+
+from rest_framework import fields
+
+from rest_enumfield import EnumField
+
+from rest_dataclasses.fields import BytesField, PathField
+from rest_dataclasses.registry import FieldRegistry, field_registry
+from rest_dataclasses.serializers import DataclassSerializer
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Tag(str):
+    pass
+
+
+@da.dataclass
+class File:
+    id: uuid.UUID
+    path: Path
+    content: bytes
+    size: float
+    hidden: bool
+    level: Level
+    tags: List[Tag] = da.field(default_factory=list)
+    scores: Dict[str, Level] = da.field(default_factory=dict)
+
+
+class TestFieldRegistry(SimpleTestCase):
+    def test_lookup(self):
+        self.assertIs(field_registry.lookup(bool), fields.BooleanField)
+        self.assertIs(field_registry.lookup(float), fields.FloatField)
+        self.assertIs(field_registry.lookup(uuid.UUID), fields.UUIDField)
+        self.assertIs(field_registry.lookup(bytes), BytesField)
+        self.assertIs(field_registry.lookup(PosixPath), PathField)
+        self.assertIs(field_registry.lookup(Tag), fields.CharField)
+        self.assertIs(field_registry.lookup(Level), EnumField)
+        self.assertIsNone(field_registry.lookup(File))
+        self.assertIsNone(field_registry.lookup(List[int]))
+
+    def test_child(self):
+        registry = FieldRegistry({str: fields.CharField})
+        child = registry.new_child({Tag: fields.SlugField})
+
+        self.assertIs(child.lookup(Tag), fields.SlugField)
+        self.assertIs(child.lookup(str), fields.CharField)
+        self.assertIs(registry.lookup(Tag), fields.CharField)
+        self.assertIn(str, child)
+        self.assertNotIn(Tag, registry)
+        self.assertEqual(child.as_dict(), {str: fields.CharField, Tag: fields.SlugField})
+        self.assertEqual(repr(registry), "<FieldRegistry {!r}>".format({str: fields.CharField}))
+
+        registry.register(int, fields.IntegerField)
+        self.assertIs(child.lookup(int), fields.IntegerField)
+
+        child.unregister(Tag)
+        self.assertIs(child.lookup(Tag), fields.CharField)
+
+    def test_register_decorator(self):
+        registry = FieldRegistry()
+
+        @registry.register(Tag)
+        class TagField(fields.CharField):
+            pass
+
+        self.assertIs(registry[Tag], TagField)
+        self.assertIs(registry.lookup(Tag), TagField)
+        with self.assertRaises(KeyError):
+            registry[str]
+
+    def test_mapping(self):
+        registry = FieldRegistry({str: fields.CharField})
+        child = registry.new_child({Tag: fields.SlugField})
+
+        self.assertEqual(dict(child), {str: fields.CharField, Tag: fields.SlugField})
+        self.assertEqual(
+            {**child, int: fields.IntegerField},
+            {str: fields.CharField, Tag: fields.SlugField, int: fields.IntegerField},
+        )
+        self.assertEqual(dict(child.items()), child)
+        self.assertEqual(child.copy(), {str: fields.CharField, Tag: fields.SlugField})
+        self.assertEqual(list(child.keys()), [str, Tag])
+        self.assertIsNone(registry.get(Tag))
+
+        child[int] = fields.IntegerField
+        self.assertIs(child.lookup(bool), fields.IntegerField)
+        del child[int]
+        self.assertIsNone(child.lookup(bool))
+
+        child.update({bool: fields.BooleanField})
+        self.assertIs(child.lookup(bool), fields.BooleanField)
+
+
+class TestSerializerFieldMapping(SimpleTestCase):
+    class Serializer(DataclassSerializer):
+        class Meta:
+            model = File
+            fields = "__all__"
+
+    def test_round_trip(self):
+        data = {
+            "id": "a4a4b2b4-5c7b-4e5e-9d7e-0b5e6f9c4d7a",
+            "path": "/tmp/file.txt",
+            "content": "aGVsbG8=",
+            "size": 1.5,
+            "hidden": False,
+            "level": "HIGH",
+            "tags": ["a"],
+            "scores": {"a": "LOW"},
+        }
+        serializer = self.Serializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        instance = serializer.save()
+
+        self.assertEqual(
+            instance,
+            File(
+                id=uuid.UUID(data["id"]),
+                path=Path("/tmp/file.txt"),
+                content=b"hello",
+                size=1.5,
+                hidden=False,
+                level=Level.HIGH,
+                tags=["a"],
+                scores={"a": Level.LOW},
+            ),
+        )
+        self.assertEqual(self.Serializer(instance).data, data)
+        self.assertEqual(self.Serializer.dump_many([instance]), [data])
+
+    def test_invalid(self):
+        serializer = self.Serializer(
+            data={"id": "1", "path": "a", "content": "!", "size": 1, "hidden": 1, "level": "MEDIUM"}
+        )
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {
+                "id": ["Must be a valid UUID."],
+                "content": ["Must be a valid base64 string."],
+                "level": ['"MEDIUM" is not a valid choice.'],
+            },
+        )
+
+    def test_bytes_data(self):
+        serializer = self.Serializer(data={"content": b"hello"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(serializer.validated_data, {"content": b"hello"})
+
+    def test_override(self):
+        class Serializer(self.Serializer):
+            serializer_field_mapping = field_registry.new_child({Tag: fields.SlugField})
+
+            class Meta:
+                model = File
+                fields = ("tags", "size")
+
+        class PlainSerializer(self.Serializer):
+            serializer_field_mapping = {str: fields.CharField, Tag: fields.EmailField, float: fields.DecimalField}
+
+            class Meta:
+                model = File
+                fields = ("tags",)
+
+        self.assertIsInstance(Serializer().fields["tags"].child, fields.SlugField)
+        self.assertIsInstance(Serializer().fields["size"], fields.FloatField)
+        self.assertIsInstance(PlainSerializer().fields["tags"].child, fields.EmailField)
+        self.assertIsInstance(self.Serializer().fields["tags"].child, fields.CharField)
+
+    def test_extend_mapping(self):
+        class Serializer(self.Serializer):
+            serializer_field_mapping = {**DataclassSerializer.serializer_field_mapping, Tag: fields.EmailField}
+
+            class Meta:
+                model = File
+                fields = ("tags", "size")
+
+        self.assertIsInstance(Serializer().fields["tags"].child, fields.EmailField)
+        self.assertIsInstance(Serializer().fields["size"], fields.FloatField)
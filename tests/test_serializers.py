@@ -1,16 +1,34 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
+import asyncio
 import dataclasses as da
 import enum
-from typing import Dict, List
+import sys
+import tracemalloc
+import unittest
+from collections import OrderedDict
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set, Tuple
+
+from asgiref.sync import async_to_sync
 
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.test import SimpleTestCase
+from django.http import QueryDict
+from django.test import SimpleTestCase, override_settings
 
-from rest_framework import fields
+from rest_framework import fields, serializers
 from rest_framework.exceptions import ValidationError
 
-from rest_dataclasses.serializers import DataclassSerializer
+from rest_dataclasses.registry import field_registry
+from rest_dataclasses.serializers import (
+    DataclassListSerializer,
+    DataclassSerializer,
+    DeferredField,
+    FieldTemplate,
+    NestedSerializerRegistry,
+)
 
 
 class Color(enum.Enum):
@@ -62,6 +80,82 @@ class Dummy:
     stuff: Dict[str, int] = da.field(default=None)
 
 
+@da.dataclass
+class Collection:
+    name: Optional[str] = None
+    ids: List[int] = da.field(default_factory=list)
+    tags: Set[str] = da.field(default_factory=set)
+    colors: Tuple[Color, ...] = ()
+    points: Tuple[Point, ...] = ()
+    origin: Optional["Point"] = None
+
+
+@da.dataclass
+class Comment:
+    text: str = None
+    replies: List["Comment"] = da.field(default_factory=list)
+    thread: Optional["Thread"] = None
+
+
+@da.dataclass
+class Thread:
+    title: str = None
+    first: Optional[Comment] = None
+
+
+@da.dataclass
+class Team:
+    name: str = None
+    members: List[User] = da.field(default_factory=list)
+
+
+@da.dataclass
+class Pair:
+    left: int
+    right: int
+    total: int = da.field(init=False, default=None)
+    init_calls = 0
+
+    def __post_init__(self):
+        Pair.init_calls += 1
+        self.total = self.left + self.right
+
+
+@da.dataclass(frozen=True)
+class FrozenPoint:
+    x: int
+    y: int = 0
+
+
+@da.dataclass(frozen=True)
+class FrozenLine:
+    a: FrozenPoint
+    b: Optional[FrozenPoint] = None
+
+
+slots = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@da.dataclass(frozen=True, **slots)
+class Price:
+    amount: int
+    currency: str = "USD"
+
+
+@da.dataclass(frozen=True, **slots)
+class Product:
+    sku: str
+    price: Price
+    tags: Tuple[str, ...] = ()
+    variants: List[Price] = da.field(default_factory=list)
+
+
+@da.dataclass(**slots)
+class SlottedPoint:
+    x: int
+    y: int
+
+
 class TestModelSerializer(SimpleTestCase):
     def test_happy_path(self):
         class Serializer(DataclassSerializer):
@@ -131,6 +225,54 @@ class TestModelSerializer(SimpleTestCase):
 
         self.assertDictEqual(da.asdict(user), {"id": 1, "name": None, "email": "some@email.com"})
 
+    def test_options(self):
+        calls = []
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = ["id", "name"]
+                read_only_fields = ("name",)
+                extra_kwargs = {"id": {"min_value": 1}}
+
+            def get_extra_kwargs(self):
+                calls.append(self)
+                return super().get_extra_kwargs()
+
+        options = Serializer().get_options()
+
+        self.assertEqual(options.fields, ("id", "name"))
+        self.assertIsNone(options.exclude)
+        self.assertEqual(options.depth, 0)
+        self.assertEqual(dict(options.extra_kwargs["name"]), {"read_only": True})
+        self.assertEqual(dict(options.extra_kwargs["id"]), {"min_value": 1})
+        with self.assertRaises(TypeError):
+            options.extra_kwargs["id"]["min_value"] = 2
+
+        for _ in range(3):
+            self.assertTrue(Serializer(data={"id": 1}).is_valid())
+        self.assertIs(Serializer().get_options(), options)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(Serializer.Meta.extra_kwargs, {"id": {"min_value": 1}})
+
+        class Meta:
+            model = User
+            fields = "__all__"
+
+        Serializer.Meta = Meta
+        self.assertIsNone(Serializer().get_options().fields)
+        self.assertEqual(len(calls), 2)
+
+    def test_bad_depth(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                depth = 6
+
+        with self.assertRaisesMessage(AssertionError, "'depth' may not be greater than 5."):
+            Serializer().fields
+
     def test_with_fields(self):
         class Serializer(DataclassSerializer):
             class Meta:
@@ -285,6 +427,11 @@ class TestModelSerializer(SimpleTestCase):
 
         self.assertDictEqual(da.asdict(user), {"id": 1, "name": "shosca", "email": None})
 
+        serializer = StarSerializer(user, data={"user": {"name": "sherlock"}, "id": 2})
+        serializer.is_valid(raise_exception=True)
+        self.assertIs(serializer.save(), user)
+        self.assertDictEqual(da.asdict(user), {"id": 2, "name": "sherlock", "email": None})
+
     def test_create_source_not_in_validated_data(self):
         class Serializer(DataclassSerializer):
             class Meta:
@@ -456,3 +603,1512 @@ class TestModelSerializer(SimpleTestCase):
         dummy = serializer.save()
 
         self.assertDictEqual(da.asdict(dummy), {"stuff": {"a": 1, "b": 2}})
+
+    def test_field_schema_is_cached_per_class(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        first, second = Serializer(), Serializer()
+
+        self.assertIs(first.get_field_schema(), second.get_field_schema())
+        self.assertIsNot(first.fields["id"], second.fields["id"])
+        self.assertIs(first.fields["id"].parent, first)
+        self.assertIs(second.fields["id"].parent, second)
+
+    def test_field_schema_invalidation(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        class SubSerializer(Serializer):
+            pass
+
+        self.assertEqual(list(SubSerializer().fields), ["id", "name", "email"])
+
+        Serializer.Meta.fields = ("id",)
+        self.assertEqual(list(SubSerializer().fields), ["id", "name", "email"])
+
+        Serializer.invalidate_field_schema()
+        self.assertEqual(list(SubSerializer().fields), ["id"])
+
+    def test_field_schema_new_meta(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        self.assertEqual(list(Serializer().fields), ["id", "name", "email"])
+
+        class Meta:
+            model = User
+            fields = ("name",)
+
+        Serializer.Meta = Meta
+        self.assertEqual(list(Serializer().fields), ["name"])
+
+    def test_nested_serializer_classes_are_reused(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        first, second = Serializer(), Serializer()
+        line_serializer = first.fields["lines"].child
+
+        self.assertIs(line_serializer.__class__, second.fields["lines"].child.__class__)
+        self.assertEqual(line_serializer.__class__.__name__, "LineSerializer")
+        self.assertTrue(issubclass(line_serializer.__class__, Serializer))
+        self.assertIs(line_serializer.fields["a"].__class__, line_serializer.fields["b"].__class__)
+        self.assertIs(line_serializer.fields["a"].__class__._nested_parent, Serializer)
+        self.assertIn((Serializer, Line, 0), Serializer.nested_serializer_registry)
+        self.assertIn((Serializer, Point, 0), Serializer.nested_serializer_registry)
+
+    def test_typing_annotations(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Collection
+                fields = "__all__"
+
+        serializer = Serializer(
+            data={
+                "name": None,
+                "ids": [1, "2"],
+                "tags": ["a", "b", "a"],
+                "colors": ["RED", "blue"],
+                "points": [{"x": 1, "y": 2}],
+                "origin": None,
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        collection = serializer.save()
+
+        self.assertEqual(
+            collection,
+            Collection(
+                ids=[1, 2], tags={"a", "b"}, colors=(Color.RED, Color.BLUE), points=(Point(x=1, y=2),), origin=None
+            ),
+        )
+        self.assertEqual(
+            Serializer(Collection(ids=[1], colors=(Color.GREEN,), origin=Point(x=1))).data,
+            {"name": None, "ids": [1], "tags": [], "colors": ["GREEN"], "points": [], "origin": {"x": 1, "y": None}},
+        )
+
+    def test_untyped_containers(self):
+        @da.dataclass
+        class Untyped:
+            items: list = None
+            mapping: dict = None
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Untyped
+                fields = "__all__"
+
+        serializer = Serializer(data={"items": [1, "a"], "mapping": {"a": [1]}})
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(serializer.save(), Untyped(items=[1, "a"], mapping={"a": [1]}))
+
+    def test_unsupported_annotation(self):
+        @da.dataclass
+        class Unsupported:
+            value: complex = None
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Unsupported
+                fields = "__all__"
+
+        with self.assertRaisesMessage(
+            AssertionError, "Couldn't find a serializer field for Unsupported.value: <class 'complex'>"
+        ):
+            Serializer().fields["value"]
+
+    def test_unsupported_container_items(self):
+        @da.dataclass
+        class Unsupported:
+            lists: List[List[int]] = None
+            mapping: Dict[str, List[Point]] = None
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Unsupported
+                fields = "__all__"
+
+        with self.assertRaisesMessage(
+            AssertionError, "Couldn't find a serializer field for Unsupported.lists: typing.List[typing.List[int]]"
+        ):
+            Serializer().fields["lists"]
+
+        with self.assertRaisesMessage(
+            AssertionError,
+            "Couldn't find a serializer field for Unsupported.mapping: typing.Dict[str, typing.List[tests.test_serializers.Point]]",
+        ):
+            Serializer().fields["mapping"]
+
+
+class TestLazyFields(SimpleTestCase):
+    def test_nested_fields_are_built_on_access(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+        serializer = Serializer(Line())
+        self.assertIsInstance(serializer.fields.fields["a"], DeferredField)
+        self.assertEqual(
+            repr(serializer.fields.fields["a"]),
+            "DeferredField(build_nested_field{!r})".format(serializer.fields.fields["a"].args),
+        )
+        self.assertIs(serializer.fields["a"].parent, serializer)
+        self.assertIsInstance(serializer.fields.fields["a"], DataclassSerializer)
+
+        # the first instance builds the per-class plans
+        self.assertEqual(Serializer(Line()).data, {"a": None, "b": None})
+        Serializer(data={}).is_valid(raise_exception=True)
+
+        serializer = Serializer(Line(a=Point(x=1, y=2)))
+        self.assertEqual(serializer.data, {"a": {"x": 1, "y": 2}, "b": None})
+        self.assertIsInstance(serializer.fields.fields["a"], DataclassSerializer)
+        self.assertIsInstance(serializer.fields.fields["b"], DeferredField)
+
+        serializer = Serializer(data={"b": {"x": 1}})
+        serializer.is_valid(raise_exception=True)
+        self.assertIsInstance(serializer.fields.fields["a"], DeferredField)
+        self.assertIsInstance(serializer.fields.fields["b"], DataclassSerializer)
+
+    def test_recursive(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Comment
+                fields = "__all__"
+
+        data = {
+            "text": "a",
+            "replies": [{"text": "b", "replies": [{"text": "c", "replies": []}]}],
+            "thread": {"title": "t", "first": {"text": "d", "replies": []}},
+        }
+        serializer = Serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        comment = serializer.save()
+
+        self.assertEqual(
+            comment,
+            Comment(
+                text="a",
+                replies=[Comment(text="b", replies=[Comment(text="c")])],
+                thread=Thread(title="t", first=Comment(text="d")),
+            ),
+        )
+
+        reply_serializer = serializer.fields["replies"].child
+        thread_serializer = serializer.fields["thread"]
+        self.assertIs(reply_serializer.fields["replies"].child.__class__, reply_serializer.__class__)
+        self.assertIs(thread_serializer.fields["first"].__class__, reply_serializer.__class__)
+        self.assertIs(thread_serializer.fields["first"].fields["thread"].__class__, thread_serializer.__class__)
+
+        self.assertEqual(
+            Serializer(comment).data,
+            {
+                "text": "a",
+                "replies": [{"text": "b", "replies": [{"text": "c", "replies": [], "thread": None}], "thread": None}],
+                "thread": {"title": "t", "first": {"text": "d", "replies": [], "thread": None}},
+            },
+        )
+
+    def test_stateless_fields_are_shared(self):
+        class NameField(fields.CharField):
+            pass
+
+        class Serializer(DataclassSerializer):
+            serializer_field_mapping = field_registry.new_child({str: NameField})
+
+            class Meta:
+                model = User
+                fields = ("id", "name")
+
+        class PointSerializer(DataclassSerializer):
+            class Meta:
+                model = Point
+                fields = "__all__"
+
+        template = PointSerializer().get_field_schema()["x"].field
+        self.assertIsNone(template.parent)
+
+        first, second = PointSerializer(data={"x": 1, "y": 2}), PointSerializer(Point(x=3, y=4))
+        self.assertTrue(first.is_valid())
+        self.assertEqual(second.data, {"x": 3, "y": 4})
+        self.assertIs(first._validation_plan[0][1], template)
+        self.assertIs(second._representation_plan[0][1], template)
+
+        # once the per-class plans exist, instances don't copy stateless fields unless they're accessed
+        serializer = PointSerializer(data={"x": 1, "y": 2})
+        self.assertTrue(serializer.is_valid())
+        self.assertIsInstance(serializer.fields.fields["x"], FieldTemplate)
+        self.assertEqual(repr(serializer.fields.fields["x"]), "FieldTemplate({!r})".format(template))
+        self.assertIsNot(serializer.fields["x"], template)
+        self.assertIs(serializer.fields["x"].parent, serializer)
+
+        # missing values go through the bound field
+        serializer = PointSerializer(Point(x=1, y=2), data={"y": 3}, partial=True)
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.save(), Point(x=1, y=3))
+        self.assertFalse(PointSerializer(data={"y": "a"}).is_valid())
+
+        # unknown field classes are built per instance
+        schema = Serializer().get_field_schema()
+        self.assertEqual([name for name, field in schema.items() if isinstance(field, FieldTemplate)], ["id"])
+        self.assertIsInstance(Serializer().fields.fields["name"], NameField)
+
+    def test_modified_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def get_fields(self):
+                ret = super().get_fields()
+                if not self.context.get("admin"):
+                    ret["name"].read_only = True
+                return ret
+
+        class HiddenSerializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["email"].write_only = True
+                self.fields["name"].read_only = True
+
+        self.assertIsInstance(Serializer().get_fields()["name"], fields.CharField)
+
+        for _ in range(2):
+            serializer = Serializer(User(id=1), data={"name": "admin"}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.save(), User(id=1))
+
+            serializer = Serializer(User(id=1), data={"name": "admin"}, partial=True, context={"admin": True})
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.save(), User(id=1, name="admin"))
+
+            serializer = HiddenSerializer(User(id=1, email="some@email.com"), data={"name": "admin"}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.validated_data, {})
+            self.assertEqual(serializer.data, {"id": 1, "name": None})
+
+    def test_modified_nested_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+            def get_fields(self):
+                ret = super().get_fields()
+                # generated nested serializers derive from this class too
+                if "lines" in ret:
+                    ret["lines"].child.fields["b"].read_only = True
+                return ret
+
+        self.assertIsInstance(Serializer().get_fields()["lines"], serializers.ListSerializer)
+
+        serializer = Serializer(data={"lines": [{"a": {"x": 1}, "b": {"x": 2}}]})
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.save(), Geometry(lines=[Line(a=Point(x=1))]))
+
+
+class TestSparseFields(SimpleTestCase):
+    def setUp(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        self.serializer_class = Serializer
+        self.geometry = Geometry(
+            lines=[Line(a=Point(x=1, y=2), b=Point(x=3, y=4)), Line(a=Point(x=5, y=6))], color=Color.RED
+        )
+
+    def test_fields(self):
+        serializer = self.serializer_class(self.geometry, fields=["lines.a.x", "lines.b"])
+
+        self.assertEqual(list(serializer.fields), ["lines"])
+        self.assertEqual(
+            serializer.data, {"lines": [{"a": {"x": 1}, "b": {"x": 3, "y": 4}}, {"a": {"x": 5}, "b": None}]}
+        )
+        self.assertEqual(list(serializer.fields["lines"].child.fields), ["a", "b"])
+
+        self.assertEqual(self.serializer_class(self.geometry).data["lines"][1], {"a": {"x": 5, "y": 6}, "b": None})
+
+    def test_omit(self):
+        serializer = self.serializer_class(self.geometry, omit="color,lines.a.y,lines.b")
+
+        self.assertEqual(serializer.data, {"lines": [{"a": {"x": 1}}, {"a": {"x": 5}}]})
+        self.assertNotIn("color", serializer.fields)
+
+    def test_context(self):
+        serializer = self.serializer_class([self.geometry], many=True, context={"fields": ["color"]})
+
+        self.assertEqual(serializer.data, [{"color": "RED"}])
+        self.assertEqual(list(serializer.child.fields), ["color"])
+
+        serializer = self.serializer_class(self.geometry, fields=["lines.a"], context={"omit": ["lines"]})
+        self.assertEqual(serializer.data, {"lines": [{"a": {"x": 1, "y": 2}}, {"a": {"x": 5, "y": 6}}]})
+
+    def test_declared_nested(self):
+        class LineSerializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+        class Serializer(self.serializer_class):
+            lines = LineSerializer(many=True)
+
+        serializer = Serializer(self.geometry, fields=["lines.b.y"])
+        self.assertEqual(serializer.data, {"lines": [{"b": {"y": 4}}, {"b": None}]})
+
+    def test_write(self):
+        serializer = self.serializer_class(
+            self.geometry, data={"color": "BLUE", "lines": []}, fields=["color"], partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        geometry = serializer.save()
+
+        self.assertEqual(geometry.color, Color.BLUE)
+        self.assertEqual(len(geometry.lines), 2)
+
+
+class TestNestedSerializerRegistry(SimpleTestCase):
+    def test_bounded(self):
+        registry = NestedSerializerRegistry(maxsize=2)
+
+        self.assertIs(registry.add("a", int), int)
+        self.assertIs(registry.add("a", str), int)
+        registry.add("b", str)
+        self.assertIs(registry.get("a"), int)
+        registry.add("c", float)
+
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.keys(), ["a", "c"])
+        self.assertEqual(list(registry), ["a", "c"])
+        self.assertEqual(registry.items(), [("a", int), ("c", float)])
+        self.assertNotIn("b", registry)
+        self.assertIsNone(registry.get("b"))
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+
+
+class TestRepresentation(SimpleTestCase):
+    def test_plain_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        serializer = Serializer(User(id=1, name="shosca", email="some@email.com"))
+
+        self.assertEqual(serializer.get_representation_plan(), (("id", "id"), ("name", "name"), ("email", "email")))
+        self.assertDictEqual(serializer.data, {"id": 1, "name": "shosca", "email": "some@email.com"})
+
+    def test_nested(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        instance = Geometry(lines=[Line(a=Point(x=1, y=2)), Line(b=Point(x=3, y=4))], color=Color.RED)
+        serializer = Serializer(instance)
+
+        self.assertEqual(serializer.data, serializers.Serializer.to_representation(serializer, instance))
+        self.assertEqual(
+            serializer.data,
+            {
+                "lines": [{"a": {"x": 1, "y": 2}, "b": None}, {"a": None, "b": {"x": 3, "y": 4}}],
+                "color": "RED",
+            },
+        )
+
+    def test_fallback_fields(self):
+        class UpperField(fields.CharField):
+            def get_attribute(self, instance):
+                return super().get_attribute(instance).upper()
+
+        class Serializer(DataclassSerializer):
+            email = fields.CharField(source="name")
+            name = UpperField()
+            user = fields.SerializerMethodField()
+
+            class Meta:
+                model = User
+                fields = ("email", "name", "user", "id")
+
+            def get_user(self, instance):
+                return da.asdict(instance)
+
+        serializer = Serializer(User(id=1, name="shosca", email="some@email.com"))
+
+        self.assertEqual(
+            serializer.get_representation_plan(), (("email", None), ("name", None), ("user", None), ("id", "id"))
+        )
+        self.assertDictEqual(
+            serializer.data,
+            {
+                "email": "shosca",
+                "name": "SHOSCA",
+                "user": {"id": 1, "name": "shosca", "email": "some@email.com"},
+                "id": 1,
+            },
+        )
+
+    def test_missing_attribute(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        self.assertDictEqual(Serializer(SimpleNamespace(id=1, email=None)).data, {"id": 1, "email": None})
+
+    def test_instance_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["label"] = fields.SerializerMethodField()
+                self.fields["name"] = fields.CharField(source="email")
+
+            def get_label(self, instance):
+                return "P{}".format(instance.id)
+
+        user = User(id=1, name="shosca", email="some@email.com")
+        for _ in range(2):
+            self.assertDictEqual(
+                Serializer(user).data, {"id": 1, "name": "some@email.com", "email": "some@email.com", "label": "P1"}
+            )
+
+    def test_context_dependent_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = ("id", "name")
+
+            def get_fields(self):
+                ret = super().get_fields()
+                if self.context.get("admin"):
+                    ret["secret"] = fields.CharField(source="email")
+                return ret
+
+        user = User(id=1, name="shosca", email="some@email.com")
+
+        self.assertDictEqual(Serializer(user).data, {"id": 1, "name": "shosca"})
+        self.assertDictEqual(
+            Serializer(user, context={"admin": True}).data, {"id": 1, "name": "shosca", "secret": "some@email.com"}
+        )
+        self.assertDictEqual(Serializer(user).data, {"id": 1, "name": "shosca"})
+
+
+class TestValidation(SimpleTestCase):
+    def test_plain_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                extra_kwargs = {"email": {"required": True}}
+
+        serializer = Serializer(data={"id": 1, "name": "shosca", "email": "some@email.com"})
+
+        self.assertEqual(
+            serializer.get_validation_plan(), (("id", "id", True), ("name", "name", True), ("email", "email", False))
+        )
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {"id": 1, "name": "shosca", "email": "some@email.com"})
+
+        serializer = Serializer(data={"id": "a", "name": None})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {
+                "id": ["A valid integer is required."],
+                "name": ["This field may not be null."],
+                "email": ["This field is required."],
+            },
+        )
+
+        serializer = Serializer(User(), data={"name": "shosca"}, partial=True)
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {"name": "shosca"})
+
+    def test_fallback_fields(self):
+        def no_admin(value):
+            if value == "admin":
+                raise DjangoValidationError("No admins")
+
+        class Serializer(DataclassSerializer):
+            email = fields.EmailField(source="name", required=False)
+
+            class Meta:
+                model = User
+                fields = ("email", "name", "id")
+                extra_kwargs = {"name": {"validators": [no_admin]}}
+
+            def validate_id(self, value):
+                if value < 0:
+                    raise ValidationError("Negative")
+                return value
+
+        serializer = Serializer(data={"id": -1, "name": "admin", "email": "shosca"})
+
+        self.assertEqual(
+            serializer.get_validation_plan(), (("email", None, True), ("name", None, True), ("id", None, True))
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {"email": ["Enter a valid email address."], "name": ["No admins"], "id": ["Negative"]},
+        )
+
+        serializer = Serializer(data={"id": 1, "email": "some@email.com"})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data, {"name": "some@email.com", "id": 1})
+
+    def test_read_only_defaults(self):
+        seen = []
+
+        class Serializer(DataclassSerializer):
+            name = fields.CharField(read_only=True, default="shosca")
+            email = fields.CharField(read_only=True, default=fields.CreateOnlyDefault("some@email.com"))
+
+            class Meta:
+                model = User
+                fields = "__all__"
+                validators = [seen.append]
+
+        Serializer(data={"id": 1}).is_valid(raise_exception=True)
+        Serializer(User(), data={"id": 2}).is_valid(raise_exception=True)
+
+        self.assertEqual(seen, [{"name": "shosca", "email": "some@email.com", "id": 1}, {"name": "shosca", "id": 2}])
+
+        class LineSerializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+                extra_kwargs = {"a": {"read_only": True, "default": None}}
+                validators = [seen.append]
+
+        LineSerializer(data={"b": {"x": 1}}).is_valid(raise_exception=True)
+        self.assertEqual(seen[-1], {"a": None, "b": {"x": 1}})
+
+    def test_django_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def validate_name(self, value):
+                if value == "admin":
+                    raise DjangoValidationError("No admins")
+                return value
+
+        serializer = Serializer(data={"id": 1, "name": "admin"})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {"name": ["No admins"]})
+
+    def test_not_a_dict(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        serializer = Serializer(data=["shosca"])
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors, {"non_field_errors": ["Invalid data. Expected a dictionary, but got list."]}
+        )
+
+    def test_context_dependent_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def get_fields(self):
+                ret = super().get_fields()
+                if not self.context.get("admin"):
+                    ret["name"] = fields.CharField(read_only=True)
+                return ret
+
+        data = {"id": 1, "name": "admin"}
+        serializer = Serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.validated_data, {"id": 1})
+
+        serializer = Serializer(data=data, context={"admin": True})
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.validated_data, {"id": 1, "name": "admin"})
+
+    def test_instance_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Point
+                fields = "__all__"
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["x"].required = True
+                self.fields["z"] = fields.IntegerField(source="y")
+                self.fields["label"] = fields.CharField(read_only=True, default="point")
+
+            def validate(self, attrs):
+                attrs["label"] = self._read_only_defaults()
+                return attrs
+
+        for _ in range(2):
+            serializer = Serializer(data={})
+            self.assertFalse(serializer.is_valid())
+            self.assertEqual(serializer.errors, {"x": ["This field is required."], "z": ["This field is required."]})
+
+            serializer = Serializer(data={"x": 1, "y": 5, "z": 7})
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.validated_data, {"x": 1, "y": 7, "label": {"label": "point"}})
+
+
+class TestUpdatePlan(SimpleTestCase):
+    def test_handlers(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+            def set_color(self, instance, field_name, value):
+                setattr(instance, field_name, value)
+
+        class PersonSerializer(DataclassSerializer):
+            class Meta:
+                model = Person
+                fields = "__all__"
+
+        class LineSerializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+        self.assertEqual(
+            Serializer().get_update_plan(),
+            (("lines", "perform_nested_list_update", None), ("color", "perform_scalar_update", "set_color")),
+        )
+        self.assertEqual(
+            PersonSerializer().get_update_plan(),
+            (("name", "perform_scalar_update", None), ("addresses", "perform_nested_dict_update", None)),
+        )
+        self.assertEqual(
+            LineSerializer().get_update_plan(),
+            (("a", "perform_nested_update", None), ("b", "perform_nested_update", None)),
+        )
+
+        serializer = Serializer(data={"color": "RED", "lines": [{"a": {"x": 1}}]})
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.save(), Geometry(lines=[Line(a=Point(x=1))], color=Color.RED))
+
+    def test_instance_fields(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = ("id",)
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["name"] = fields.CharField()
+                self.fields["id"].read_only = True
+
+        for _ in range(2):
+            serializer = Serializer(User(id=1), data={"id": 2, "name": "shosca"})
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.save(), User(id=1, name="shosca"))
+
+    def test_update_attribute(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+            def set_email(self, instance, field_name, value):
+                setattr(instance, field_name, "mailto:" + value)
+
+            def update_attribute(self, instance, field, value):
+                super().update_attribute(instance, field, value.upper() if isinstance(value, str) else value)
+
+        class PointSerializer(DataclassSerializer):
+            class Meta:
+                model = FrozenPoint
+                fields = "__all__"
+
+            def update_attribute(self, instance, field, value):
+                super().update_attribute(instance, field, value * 2)
+
+        serializer = Serializer(User(id=1), data={"name": "shosca", "email": "some@email.com"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.save(), User(id=1, name="SHOSCA", email="mailto:SOME@EMAIL.COM"))
+
+        serializer = PointSerializer(FrozenPoint(x=1), data={"y": 2}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.save(), FrozenPoint(x=1, y=4))
+
+        serializer = PointSerializer(data={"x": 1})
+        serializer.is_valid(raise_exception=True)
+        self.assertEqual(serializer.save(), FrozenPoint(x=2))
+
+
+class TestListSerializer(SimpleTestCase):
+    def test_create_many(self):
+        saved = []
+
+        class ListSerializer(DataclassListSerializer):
+            def create_many(self, validated_data):
+                instances = super().create_many(validated_data)
+                saved.append(instances)
+                return instances
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = ListSerializer
+
+        serializer = Serializer(data=[{"id": 1, "name": "shosca"}, {"id": 2, "name": "sherlock"}], many=True)
+        self.assertIsInstance(serializer, ListSerializer)
+        serializer.is_valid(raise_exception=True)
+        users = serializer.save()
+
+        self.assertEqual(users, [User(id=1, name="shosca"), User(id=2, name="sherlock")])
+        self.assertEqual(saved, [users])
+
+    def test_update_many(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        instances = [Line(a=Point(x=1, y=2))]
+        serializer = Serializer(instances, data=[{"a": {"x": 3}}, {"b": {"x": 5, "y": 6}}], many=True, partial=True)
+        serializer.is_valid(raise_exception=True)
+        lines = serializer.save()
+
+        self.assertIs(lines[0], instances[0])
+        self.assertEqual(lines, [Line(a=Point(x=3, y=2)), Line(b=Point(x=5, y=6))])
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_update_many_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+            def set_name(self, instance, field_name, value):
+                raise ValueError("Bad", value)
+
+        serializer = Serializer([User()], data=[{"name": "shosca"}], many=True)
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {0: {"name": ["Bad shosca"]}})
+
+    def test_nested_list_serializer_class(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        self.assertIsInstance(Serializer().fields["lines"], DataclassListSerializer)
+
+
+class TestChangeTracking(SimpleTestCase):
+    def test_noop(self):
+        calls = []
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+            def set_color(self, instance, field_name, value):
+                calls.append(value)
+                setattr(instance, field_name, value)
+
+        lines = [Line(a=Point(x=1, y=2))]
+        instance = Geometry(lines=lines, color=Color.RED)
+        serializer = Serializer(instance, data={"color": "RED", "lines": [{"a": {"x": 1, "y": 2}}]}, track_changes=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(serializer.changes, [])
+        self.assertEqual(calls, [])
+        self.assertIs(instance.lines, lines)
+
+    def test_changes(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Geometry
+                fields = "__all__"
+
+        a = Point(x=1, y=2)
+        instance = Geometry(lines=[Line(a=a)], color=Color.RED)
+        serializer = Serializer(
+            instance,
+            data={"color": "BLUE", "lines": [{"a": {"x": 5}}, {"a": {"x": 3}}]},
+            partial=True,
+            track_changes=True,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.changes,
+            [("lines.0.a.x", 1, 5), ("lines.1", None, Line(a=Point(x=3))), ("color", Color.RED, Color.BLUE)],
+        )
+        self.assertEqual(instance, Geometry(lines=[Line(a=Point(x=5, y=2)), Line(a=Point(x=3))], color=Color.BLUE))
+        self.assertIs(instance.lines[0].a, a)
+
+    def test_nested_changes(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Person
+                fields = "__all__"
+
+        home = Address(street="221B Baker Street", city="London")
+        instance = Person(name="Sherlock Holmes", addresses={"home": home, "work": Address(city="London")})
+        serializer = Serializer(
+            instance,
+            data={"name": "Sherlock Holmes", "addresses": {"home": {"city": "London"}, "lab": {"city": "Paris"}}},
+            partial=True,
+            track_changes=True,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(
+            serializer.changes,
+            [("addresses.lab", None, Address(city="Paris")), ("addresses.work", Address(city="London"), None)],
+        )
+        self.assertEqual(instance.addresses, {"home": home, "lab": Address(city="Paris")})
+
+    def test_unchanged_dict(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Person
+                fields = "__all__"
+
+        addresses = {"home": Address(city="London")}
+        instance = Person(name="Sherlock Holmes", addresses=addresses)
+        serializer = Serializer(
+            instance, data={"addresses": {"home": {"city": "London"}}}, partial=True, track_changes=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(serializer.changes, [])
+        self.assertIs(instance.addresses, addresses)
+
+    def test_star_source(self):
+        class UserSerializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = ("name", "email")
+
+        class Serializer(DataclassSerializer):
+            user = UserSerializer(source="*")
+
+            class Meta:
+                model = User
+                fields = ("id", "user")
+
+        instance = User(id=1, name="shosca", email="some@email.com")
+        serializer = Serializer(
+            instance, data={"id": 1, "user": {"name": "sherlock"}}, partial=True, track_changes=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(serializer.changes, [("name", "shosca", "sherlock")])
+        self.assertEqual(instance, User(id=1, name="sherlock", email="some@email.com"))
+
+    def test_partial_keeps_missing_collections(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Person
+                fields = "__all__"
+
+        addresses = {"work": Address(city="London")}
+        instance = Person(addresses=addresses)
+        serializer = Serializer(instance, data={"name": "Sherlock Holmes"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertIsNone(serializer.changes)
+        self.assertIs(instance.addresses, addresses)
+
+    def test_many(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        instances = [User(id=1, name="shosca"), User(id=2)]
+        serializer = Serializer(
+            instances, data=[{"id": 1, "name": "shosca"}, {"id": 2, "name": "sherlock"}], many=True, track_changes=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(serializer.changes, [("1.name", None, "sherlock")])
+
+
+class TestMatchOn(SimpleTestCase):
+    def test_nested_list(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Team
+                fields = "__all__"
+                extra_kwargs = {"members": {"match_on": "id"}}
+
+        first, second, third = User(id=1, name="shosca"), User(id=2), User(id=3, name="sherlock")
+        instance = Team(members=[first, second, third])
+        serializer = Serializer(
+            instance,
+            data={"members": [{"id": 3, "name": "sherlock"}, {"id": 4}, {"id": 1, "name": "watson"}]},
+            partial=True,
+            track_changes=True,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(instance.members, [third, User(id=4), first])
+        self.assertIs(instance.members[0], third)
+        self.assertIs(instance.members[2], first)
+        self.assertEqual(
+            serializer.changes,
+            [("members.4", None, User(id=4)), ("members.1.name", "shosca", "watson"), ("members.2", second, None)],
+        )
+
+    def test_reorder(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Team
+                fields = "__all__"
+                extra_kwargs = {"members": {"match_on": "id"}}
+
+        first, second = User(id=1), User(id=2)
+        instance = Team(members=[first, second])
+        serializer = Serializer(instance, data={"members": [{"id": 2}, {"id": 1}]}, partial=True, track_changes=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.assertEqual(instance.members, [second, first])
+        self.assertEqual(serializer.changes, [("members", [first, second], [second, first])])
+
+    def test_many(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        first, second = User(id=1, name="shosca"), User(id=2)
+        serializer = Serializer([first, second], data=[{"id": 2, "name": "sherlock"}], many=True, match_on="id")
+        serializer.is_valid(raise_exception=True)
+        users = serializer.save()
+
+        self.assertEqual(users, [User(id=2, name="sherlock")])
+        self.assertIs(users[0], second)
+
+    def test_bad_field(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        with self.assertRaisesMessage(AssertionError, 'Cannot match on "pk", it is not a field of Serializer'):
+            Serializer([User(id=1)], data=[{"id": 1}], many=True, match_on="pk")
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Team
+                fields = "__all__"
+                extra_kwargs = {"members": {"match_on": "id"}}
+
+            def set_name(self, instance, field_name, value):
+                raise ValueError("Bad name")
+
+        instance = Team(members=[User(id=1), User(id=7)])
+        serializer = Serializer(
+            instance,
+            data={"members": [{"id": 7, "name": "a"}, {"id": 1}, {"id": 9, "name": "b"}]},
+            partial=True,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as ctx:
+            serializer.save()
+        self.assertEqual(ctx.exception.detail, {"members": {0: {"name": ["Bad name"]}, 2: {"name": ["Bad name"]}}})
+
+
+class TestConstruction(SimpleTestCase):
+    def test_init(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Pair
+                fields = ("left", "right")
+
+        Pair.init_calls = 0
+        serializer = Serializer(data={"left": 1, "right": 2})
+        serializer.is_valid(raise_exception=True)
+        pair = serializer.save()
+
+        self.assertEqual((pair.left, pair.right, pair.total), (1, 2, 3))
+        self.assertEqual(Pair.init_calls, 1)
+
+    def test_required(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Pair
+                fields = "__all__"
+
+        serializer = Serializer(data={"left": 1})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {"right": ["This field is required."]})
+        self.assertFalse(Serializer().fields["total"].required)
+
+    def test_required_with_setter(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Pair
+                fields = ("left", "right")
+
+            def set_right(self, instance, field_name, value):
+                setattr(instance, field_name, value * 10)
+
+        serializer = Serializer(data={"left": 1, "right": 2})
+        serializer.is_valid(raise_exception=True)
+        pair = serializer.save()
+
+        # the setter runs once the instance is built
+        self.assertEqual((pair.left, pair.right, pair.total), (1, 20, 3))
+
+    def test_missing_init_argument(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Pair
+                fields = ("left",)
+
+        serializer = Serializer(data={"left": 1})
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {"right": ["This field is required."]})
+        self.assertEqual(e.exception.detail["right"][0].code, "required")
+
+    def test_create_with_instance(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = User
+                fields = "__all__"
+
+        user = User(id=1)
+        serializer = Serializer(user)
+
+        self.assertIs(serializer.create({"name": "shosca"}), user)
+        self.assertEqual(user, User(id=1, name="shosca"))
+
+    def test_handler_errors(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Line
+                fields = "__all__"
+
+            def perform_nested_update(self, field, instance, validated_data, errors, changes=None):
+                if field.field_name == "a":
+                    raise ValueError("Bad")
+                raise DjangoValidationError({"b": ["Worse"]})
+
+        serializer = Serializer(data={"a": {"x": 1}, "b": {"x": 2}})
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {"a": ["Bad"], "b": ["Worse"]})
+
+    def test_post_init_error(self):
+        @da.dataclass
+        class Positive:
+            value: int
+
+            def __post_init__(self):
+                if self.value < 0:
+                    raise DjangoValidationError({"value": ["Must be positive."]})
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Positive
+                fields = "__all__"
+
+        serializer = Serializer(data={"value": -1})
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(ValidationError) as e:
+            serializer.save()
+
+        self.assertEqual(e.exception.detail, {"value": ["Must be positive."]})
+
+    def test_frozen(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = FrozenLine
+                fields = "__all__"
+
+        serializer = Serializer(data={"a": {"x": 1, "y": 2}})
+        serializer.is_valid(raise_exception=True)
+        line = serializer.save()
+
+        self.assertEqual(line, FrozenLine(a=FrozenPoint(x=1, y=2)))
+
+        serializer = Serializer(line, data={"a": {"x": 3}, "b": {"x": 4}}, partial=True, track_changes=True)
+        serializer.is_valid(raise_exception=True)
+        updated = serializer.save()
+
+        self.assertEqual(line, FrozenLine(a=FrozenPoint(x=1, y=2)))
+        self.assertEqual(updated, FrozenLine(a=FrozenPoint(x=3, y=2), b=FrozenPoint(x=4)))
+        self.assertEqual(serializer.changes, [("a.x", 1, 3), ("b", None, FrozenPoint(x=4))])
+
+    def test_frozen_non_init_fields(self):
+        @da.dataclass(frozen=True)
+        class Frozen:
+            x: int
+            z: int = da.field(init=False, default=5)
+            w: int = da.field(init=False)
+
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = Frozen
+                fields = ("x", "z")
+
+        instance = Frozen(x=1)
+        object.__setattr__(instance, "z", 7)
+
+        serializer = Serializer(instance, data={"x": 2}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        updated = serializer.save()
+        self.assertEqual((updated.x, updated.z), (2, 7))
+        self.assertFalse(hasattr(updated, "w"))
+
+        serializer = Serializer(instance, data={"x": 3, "z": 8}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        updated = serializer.save()
+        self.assertEqual((updated.x, updated.z), (3, 8))
+
+    def test_frozen_many(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                model = FrozenPoint
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        points = [FrozenPoint(x=1), FrozenPoint(x=2)]
+        serializer = Serializer(points, data=[{"x": 1}, {"x": 5, "y": 6}], many=True)
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(serializer.save(), [FrozenPoint(x=1), FrozenPoint(x=5, y=6)])
+        self.assertEqual(points, [FrozenPoint(x=1), FrozenPoint(x=2)])
+
+
+@unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need python 3.10")
+class TestSlots(SimpleTestCase):
+    class Serializer(DataclassSerializer):
+        class Meta:
+            model = Product
+            fields = "__all__"
+            list_serializer_class = DataclassListSerializer
+
+    def test_round_trip(self):
+        data = {
+            "sku": "a-1",
+            "price": {"amount": 100},
+            "tags": ["new"],
+            "variants": [{"amount": 90, "currency": "EUR"}],
+        }
+        serializer = self.Serializer(data=data)
+        serializer.is_valid(raise_exception=True)
+        product = serializer.save()
+
+        self.assertFalse(hasattr(product, "__dict__"))
+        self.assertEqual(
+            product, Product(sku="a-1", price=Price(amount=100), tags=("new",), variants=[Price(90, "EUR")])
+        )
+        self.assertEqual(self.Serializer(product).data, dict(data, price={"amount": 100, "currency": "USD"}))
+
+    def test_update(self):
+        price = Price(amount=100)
+        product = Product(sku="a-1", price=price, variants=[Price(amount=90)])
+
+        serializer = self.Serializer(product, data={"price": {"amount": 100}, "sku": "a-1"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        self.assertIs(serializer.save(), product)
+
+        serializer = self.Serializer(
+            product, data={"price": {"amount": 120}, "variants": [{"amount": 90}]}, partial=True, track_changes=True
+        )
+        serializer.is_valid(raise_exception=True)
+        updated = serializer.save()
+
+        self.assertEqual(updated, Product(sku="a-1", price=Price(amount=120), variants=[Price(amount=90)]))
+        self.assertIs(updated.variants, product.variants)
+        self.assertIs(product.price, price)
+        self.assertEqual(serializer.changes, [("price.amount", 100, 120)])
+
+    def test_many_memory(self):
+        class Serializer(DataclassSerializer):
+            class Meta:
+                fields = "__all__"
+                list_serializer_class = DataclassListSerializer
+
+        def measure(model):
+            serializer = type(
+                "Serializer", (Serializer,), {"Meta": type("Meta", (Serializer.Meta,), {"model": model})}
+            )(data=[{"x": i, "y": i} for i in range(10000)], many=True)
+            serializer.is_valid(raise_exception=True)
+
+            tracemalloc.start()
+            try:
+                instances = serializer.save()
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            self.assertEqual(len(instances), 10000)
+            return size
+
+        self.assertLess(measure(SlottedPoint), measure(Point) * 0.8)
+
+
+@da.dataclass
+class Invoice:
+    number: int
+    total: Decimal
+    issued: date
+    color: Color = Color.RED
+    notes: Optional[str] = None
+    lines: List[Line] = da.field(default_factory=list)
+    prices: Dict[str, Price] = da.field(default_factory=dict)
+
+
+class TestDumpMany(SimpleTestCase):
+    class Serializer(DataclassSerializer):
+        class Meta:
+            model = Invoice
+            exclude = ("notes",)
+            extra_kwargs = {"total": {"max_digits": 10, "decimal_places": 2}, "issued": {"write_only": True}}
+
+    def invoices(self):
+        return [
+            Invoice(
+                number=i,
+                total=Decimal("10.5"),
+                issued=date(2020, 1, i + 1),
+                lines=[Line(a=Point(x=i, y=i))],
+                prices={"eu": Price(amount=i, currency="EUR")},
+            )
+            for i in range(3)
+        ]
+
+    def test_dict(self):
+        invoices = self.invoices()
+        dumped = self.Serializer.dump_many(invoices)
+
+        self.assertEqual(dumped, self.Serializer(invoices, many=True).data)
+        self.assertEqual(
+            dumped[0],
+            {
+                "number": 0,
+                "total": "10.50",
+                "color": "RED",
+                "lines": [{"a": {"x": 0, "y": 0}, "b": None}],
+                "prices": {"eu": {"amount": 0, "currency": "EUR"}},
+            },
+        )
+        self.assertIs(type(dumped[0]), dict)
+
+    def test_tuple(self):
+        dumped = self.Serializer.dump_many(self.invoices()[:1], output="tuple")
+
+        self.assertEqual(
+            dumped,
+            [(0, "10.50", "RED", [{"a": {"x": 0, "y": 0}, "b": None}], {"eu": {"amount": 0, "currency": "EUR"}})],
+        )
+
+    def test_columns(self):
+        dumped = self.Serializer.dump_many(self.invoices(), output="columns")
+
+        self.assertEqual(list(dumped), ["number", "total", "color", "lines", "prices"])
+        self.assertEqual(dumped["number"], [0, 1, 2])
+        self.assertEqual(dumped["total"], ["10.50"] * 3)
+        self.assertEqual(self.Serializer.dump_many([], output="columns")["number"], [])
+
+    def test_declared_and_recursive(self):
+        class Serializer(DataclassSerializer):
+            upper = fields.SerializerMethodField()
+
+            class Meta:
+                model = Comment
+                fields = ("text", "upper", "replies")
+
+            def get_upper(self, instance):
+                return instance.text.upper()
+
+        comment = Comment(text="a", replies=[Comment(text="b", replies=[Comment(text="c")])])
+
+        self.assertEqual(Serializer.dump_many([comment]), Serializer([comment], many=True).data)
+
+    def test_containers(self):
+        @da.dataclass
+        class Tally:
+            counts: Dict[str, int]
+            points: List[Point]
+
+        class PointSerializer(DataclassSerializer):
+            class Meta:
+                model = Point
+                fields = "__all__"
+
+        class Serializer(DataclassSerializer):
+            points = fields.ListField(child=PointSerializer())
+            origin = fields.IntegerField(source="origin.x", required=False)
+
+            class Meta:
+                model = Tally
+                fields = ("counts", "points", "origin")
+
+        tally = Tally(counts={"a": 1, "b": 2}, points=[Point(x=1, y=2), None])
+        dumped = Serializer.dump_many([tally])
+
+        self.assertEqual(dumped, [{"counts": {"a": 1, "b": 2}, "points": [{"x": 1, "y": 2}, None], "origin": None}])
+        self.assertIsNot(dumped[0]["counts"], tally.counts)
+
+    def test_unknown_output(self):
+        with self.assertRaisesMessage(ValueError, 'Unknown output "xml", expected "dict", "tuple" or "columns"'):
+            self.Serializer.dump_many([], output="xml")
+
+
+class TestAsync(SimpleTestCase):
+    class Serializer(DataclassSerializer):
+        class Meta:
+            model = User
+            fields = "__all__"
+            list_serializer_class = DataclassListSerializer
+
+        async def validate_name(self, value):
+            await asyncio.sleep(0)
+            if value == "admin":
+                raise ValidationError("No admins")
+            return value.title()
+
+        async def set_email(self, instance, field_name, value):
+            await asyncio.sleep(0)
+            if value.endswith("@example.com"):
+                raise ValueError("No examples")
+            instance.email = value.lower()
+
+    def test_is_valid_and_save(self):
+        @async_to_sync
+        async def run():
+            serializer = self.Serializer(data={"id": 1, "name": "shosca", "email": "Some@Email.com"})
+            self.assertTrue(await serializer.ais_valid())
+            return await serializer.asave(), await serializer.adata()
+
+        user, data = run()
+
+        self.assertEqual(user, User(id=1, name="Shosca", email="some@email.com"))
+        self.assertEqual(data, {"id": 1, "name": "Shosca", "email": "some@email.com"})
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_errors(self):
+        @async_to_sync
+        async def run():
+            serializer = self.Serializer(data=[{"name": "admin"}, {"name": "a"}], many=True)
+            self.assertFalse(await serializer.ais_valid())
+            with self.assertRaises(ValidationError):
+                await serializer.ais_valid(raise_exception=True)
+            validation_errors = serializer.errors
+
+            serializer = self.Serializer(User(id=1), data={"email": "a@example.com"}, partial=True)
+            await serializer.ais_valid(raise_exception=True)
+            with self.assertRaises(ValidationError) as ctx:
+                await serializer.asave()
+            return validation_errors, ctx.exception.detail
+
+        validation_errors, save_errors = run()
+
+        self.assertEqual(validation_errors, {0: {"name": ["No admins"]}})
+        self.assertEqual(save_errors, {"email": ["No examples"]})
+
+    def test_sync_api_runs_coroutine_hooks(self):
+        serializer = self.Serializer(data={"id": 1, "name": "shosca", "email": "Some@Email.com"})
+        serializer.is_valid(raise_exception=True)
+
+        self.assertEqual(serializer.save(), User(id=1, name="Shosca", email="some@email.com"))
+
+    def test_mappings(self):
+        for data in (QueryDict("id=1&name=shosca"), OrderedDict([("id", 1), ("name", "shosca")])):
+            serializer = self.Serializer(data=data)
+            serializer.is_valid(raise_exception=True)
+            self.assertEqual(serializer.validated_data, {"id": 1, "name": "Shosca"})
+
+        serializer = self.Serializer(data=QueryDict("name=admin"))
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {"name": ["No admins"]})
+
+    def test_iter_representation(self):
+        users = [User(id=i, name="user {}".format(i)) for i in range(250)]
+
+        async def ausers():
+            for user in users:
+                yield user
+
+        @async_to_sync
+        async def run(iterable, ticks):
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            ticker = asyncio.ensure_future(tick())
+            try:
+                return [
+                    item async for item in self.Serializer(many=True).aiter_representation(iterable, chunk_size=100)
+                ]
+            finally:
+                ticker.cancel()
+
+        expected = self.Serializer(users, many=True).data
+
+        ticks = []
+        self.assertEqual(run(iter(users), ticks), expected)
+        self.assertGreaterEqual(len(ticks), 3)
+        self.assertEqual(run(ausers(), []), expected)
+        self.assertEqual(run([], []), [])
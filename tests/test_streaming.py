@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, unicode_literals
+import io
+import json
+import types
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework.exceptions import ParseError
+
+from rest_dataclasses.serializers import DataclassListSerializer, DataclassSerializer
+from rest_dataclasses.streaming import (
+    StreamingJSONParser,
+    StreamingJSONRenderer,
+    StreamingJSONResponse,
+    iter_json_array,
+)
+
+from .test_serializers import Color, Geometry, Line, Point
+
+
+class GeometrySerializer(DataclassSerializer):
+    class Meta:
+        model = Geometry
+        fields = "__all__"
+        list_serializer_class = DataclassListSerializer
+
+
+def geometries(count):
+    for i in range(count):
+        yield Geometry(lines=[Line(a=Point(x=i, y=i))], color=Color.RED)
+
+
+class TestStreaming(SimpleTestCase):
+    def test_iter_representation(self):
+        consumed = []
+
+        def instances():
+            for geometry in geometries(3):
+                consumed.append(geometry)
+                yield geometry
+
+        items = GeometrySerializer(many=True).iter_representation(instances())
+
+        self.assertEqual(next(items), {"lines": [{"a": {"x": 0, "y": 0}, "b": None}], "color": "RED"})
+        self.assertEqual(len(consumed), 1)
+        self.assertEqual(len(list(items)), 2)
+
+    def test_iter_render(self):
+        renderer = StreamingJSONRenderer()
+        items = GeometrySerializer().iter_representation(geometries(100))
+
+        chunks = list(renderer.iter_render(items, chunk_size=1024))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 2 * 1024 for chunk in chunks))
+        self.assertEqual(
+            json.loads(b"".join(chunks)),
+            GeometrySerializer(list(geometries(100)), many=True).data,
+        )
+
+    def test_iter_render_empty(self):
+        self.assertEqual(list(StreamingJSONRenderer().iter_render([])), [b"[]"])
+        self.assertEqual(list(StreamingJSONRenderer().iter_render([None, 1])), [b"[null,1]"])
+
+    def test_response(self):
+        response = StreamingJSONResponse(GeometrySerializer().iter_representation(geometries(2)))
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            [
+                {"lines": [{"a": {"x": 0, "y": 0}, "b": None}], "color": "RED"},
+                {"lines": [{"a": {"x": 1, "y": 1}, "b": None}], "color": "RED"},
+            ],
+        )
+
+
+class TestStreamingIngest(SimpleTestCase):
+    def test_iter_json_array(self):
+        document = '[12345, 2.5e10, "a,]b", {"x": [1, {"y": null}]}, true, false, null, -1.5E-3]'
+        for chunk_size in (1, 2, 3, 7, 1024):
+            self.assertEqual(
+                list(iter_json_array(io.BytesIO(document.encode()), chunk_size=chunk_size)), json.loads(document)
+            )
+
+        self.assertEqual(list(iter_json_array(io.BytesIO(b" [ ] "))), [])
+
+    def test_iter_json_array_errors(self):
+        for document, message in [
+            (b"", "JSON parse error - unexpected end of data"),
+            (b"{}", "JSON parse error - expected an array"),
+            (b"[1", "JSON parse error - unexpected end of data"),
+            (b"[1 2]", "JSON parse error - expected ',' or ']' after an array item"),
+            (b"[1,]", "JSON parse error - invalid item"),
+            (b"[1]junk", "JSON parse error - unexpected data after the array"),
+            (b"[] []", "JSON parse error - unexpected data after the array"),
+        ]:
+            with self.assertRaisesMessage(ParseError, message):
+                list(iter_json_array(io.BytesIO(document), chunk_size=2))
+
+    def test_iter_json_array_large_item(self):
+        document = json.dumps([{"x": "a" * 10000}, 1]).encode()
+        stream = io.BytesIO(document)
+        with mock.patch.object(stream, "read", wraps=stream.read) as read:
+            self.assertEqual(list(iter_json_array(stream, chunk_size=1)), json.loads(document))
+        self.assertLess(read.call_count, 50)
+
+    def test_parser(self):
+        items = StreamingJSONParser().parse(io.BytesIO(b'[{"lines": []}, {"color": "RED"}]'))
+
+        self.assertIsInstance(items, types.GeneratorType)
+        self.assertEqual(list(items), [{"lines": []}, {"color": "RED"}])
+
+    @override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+    def test_ingest(self):
+        consumed = []
+        items = StreamingJSONParser().parse(
+            io.BytesIO(
+                json.dumps(
+                    [{"lines": [{"a": {"x": i}}], "color": "RED"} for i in range(5)]
+                    + [{"color": "PINK"}, {"lines": [{"a": {"x": "a"}}]}, "bad"]
+                ).encode()
+            )
+        )
+
+        serializer = GeometrySerializer(data=items, many=True)
+        errors = serializer.ingest(consumed.append, chunk_size=2)
+
+        self.assertEqual([len(chunk) for chunk in consumed], [2, 2, 1])
+        self.assertEqual(consumed[2], [Geometry(lines=[Line(a=Point(x=4))], color=Color.RED)])
+        self.assertEqual(list(errors), [5, 6, 7])
+        self.assertEqual(errors[5], {"color": ['"PINK" is not a valid choice.']})
+        self.assertEqual(errors[6], {"lines": {0: {"a": {"x": ["A valid integer is required."]}}}})
+        self.assertEqual(errors[7], {"non_field_errors": ["Invalid data. Expected a dictionary, but got str."]})
+
+    def test_iter_ingest(self):
+        class Serializer(GeometrySerializer):
+            def set_color(self, instance, field_name, value):
+                raise ValueError("No colors")
+
+        errors = {}
+        instances = Serializer(data=[{"lines": []}, {"color": "RED"}], many=True).iter_ingest(errors)
+
+        self.assertEqual(next(instances), Geometry(lines=[]))
+        self.assertEqual(list(instances), [])
+        self.assertEqual(errors, {1: {"color": ["No colors"]}})
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
 from django.core.exceptions import ValidationError
+from django.test import override_settings
 
-from rest_dataclasses.utils import _django_to_drf
+from rest_dataclasses.utils import _django_to_drf, list_errors_as_dict, parse_field_paths
 
 
 class TestUtils(unittest.TestCase):
@@ -14,3 +17,20 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(_django_to_drf({"hello": "world"}), {"hello": "world"})
         self.assertEqual(_django_to_drf(ValidationError("hello")), ["hello"])
         self.assertEqual(_django_to_drf(ValidationError({"hello": "world"})), {"hello": ["world"]})
+
+    def test_list_errors_as_dict(self):
+        with override_settings(REST_FRAMEWORK={"LIST_SERIALIZER_ERRORS_AS_DICT": False}):
+            self.assertFalse(list_errors_as_dict())
+
+        # DRF releases without the setting only see it in the user settings
+        with mock.patch("rest_dataclasses.utils.api_settings", SimpleNamespace(user_settings={})):
+            self.assertFalse(list_errors_as_dict())
+        settings = SimpleNamespace(user_settings={"LIST_SERIALIZER_ERRORS_AS_DICT": True})
+        with mock.patch("rest_dataclasses.utils.api_settings", settings):
+            self.assertTrue(list_errors_as_dict())
+
+    def test_parse_field_paths(self):
+        self.assertIsNone(parse_field_paths(None))
+        self.assertEqual(parse_field_paths("a, b.c"), {"a": None, "b": {"c": None}})
+        self.assertEqual(parse_field_paths(["a.b", "a", "a.c"]), {"a": None})
+        self.assertEqual(parse_field_paths(["a.b.c", "a.b.d", "a.e"]), {"a": {"b": {"c": None, "d": None}, "e": None}})